@@ -0,0 +1,2022 @@
+# SPDX-FileCopyrightText: 2020 Kattni Rembor for Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_clue`
+================================================================================
+
+A high level library representing all the features of the Adafruit CLUE.
+
+
+* Author(s): Kattni Rembor
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+.. "* `Adafruit CLUE - nRF52840 Express with Bluetooth LE <https://www.adafruit.com/product/4500>`_"
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://github.com/adafruit/circuitpython/releases
+
+ * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+ * Adafruit's Register library: https://github.com/adafruit/Adafruit_CircuitPython_Register
+ * Adafruit's LSM6DS CircuitPython Library:
+   https://github.com/adafruit/Adafruit_CircuitPython_LSM6DS
+ * Adafruit's LIS3MDL CircuitPython Library:
+   https://github.com/adafruit/Adafruit_CircuitPython_LIS3MDL
+ * Adafruit's APDS9960 CircuitPython Library:
+   https://github.com/adafruit/Adafruit_CircuitPython_APDS9960
+ * Adafruit's BMP280 CircuitPython Library:
+   https://github.com/adafruit/Adafruit_CircuitPython_BMP280
+ * Adafruit's SHT31D CircuitPython Library:
+   https://github.com/adafruit/Adafruit_CircuitPython_SHT31D
+ * Adafruit's NeoPixel CircuitPython Library:
+   https://github.com/adafruit/Adafruit_CircuitPython_NeoPixel
+"""
+
+try:
+    from typing import List, Optional, Tuple, Union
+except ImportError:
+    pass
+
+import array
+import math
+import time
+from collections import namedtuple
+
+import board
+import digitalio
+import touchio
+from microcontroller import Pin
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_CLUE.git"
+
+# Sample rates in Hz that the LSM6DS supports, in order of their register values from 1.
+_LSM6DS_RATES = (12.5, 26, 52, 104, 208, 416, 833, 1666, 3332, 6664)
+
+# The number of waveform tables Clue keeps for tones. See Clue._waveform().
+_WAVEFORM_CACHE_SIZE = 8
+_WAVEFORMS = ("sine", "square", "triangle", "sawtooth")
+
+_SENSOR_NAMES = (
+    "acceleration",
+    "gyro",
+    "magnetic",
+    "proximity",
+    "color",
+    "humidity",
+    "pressure",
+    "temperature",
+    "altitude",
+)
+
+# Properties whose readings can be cached with Clue.cache_policy().
+_CACHEABLE_SENSORS = ("humidity", "pressure", "temperature", "altitude")
+
+# Microphone profiles: sample rate, sound_level samples and default FFT size. See mic_profile.
+_MIC_PROFILES = {
+    "level_meter": (16000, 64, 128),
+    "default": (16000, 160, 256),
+    "analysis": (16000, 512, 1024),
+}
+
+SensorReadings = namedtuple("SensorReadings", _SENSOR_NAMES)
+"""The record returned by :meth:`Clue.read_all`. Sensors that were not requested are ``None``."""
+
+
+# ulab.numpy on CircuitPython, or NumPy elsewhere, once _numpy() has looked for it, or False if
+# neither is available.
+_np = None
+
+
+def _numpy():
+    """Return ulab.numpy or NumPy to process microphone samples with, or ``None`` if neither is
+    available. It is only imported the first time a microphone feature needs it."""
+    global _np  # noqa: PLW0603
+    if _np is None:
+        try:
+            from ulab import numpy as _np  # noqa: PLC0415
+        except ImportError:
+            try:
+                import numpy as _np  # noqa: PLC0415
+            except ImportError:
+                _np = False
+    return _np or None
+
+
+class Clue:
+    """Represents a single CLUE."""
+
+    # Color variables available for import.
+    RED = (255, 0, 0)
+    YELLOW = (255, 255, 0)
+    ORANGE = (255, 150, 0)
+    GREEN = (0, 255, 0)
+    TEAL = (0, 255, 120)
+    CYAN = (0, 255, 255)
+    BLUE = (0, 0, 255)
+    PURPLE = (180, 0, 255)
+    MAGENTA = (255, 0, 150)
+    WHITE = (255, 255, 255)
+    BLACK = (0, 0, 0)
+
+    GOLD = (255, 222, 30)
+    PINK = (242, 90, 255)
+    AQUA = (50, 255, 255)
+    JADE = (0, 255, 40)
+    AMBER = (255, 100, 0)
+    VIOLET = (255, 0, 255)
+    SKY = (0, 180, 255)
+
+    RAINBOW = (RED, ORANGE, YELLOW, GREEN, BLUE, PURPLE)
+
+    def __init__(self, mic_profile: str = "default"):
+        # Define I2C:
+        # Like touch and the sensors below, the I2C bus is only created when it is first needed.
+        self._i2c = None
+
+        # Define touch:
+        # Initially, self._touches is an empty dictionary. When a touch is used
+        # for the first time, the pin is added as a key to the dictionary, with
+        # the corresponding TouchIn object added as the value. This saves a
+        # little RAM by only populating the dictionary as needed.
+        # For example, after `clue.touch_2`, self._touches is equivalent to:
+        # { board.P2, touchio.TouchIn(board.P2) }
+        self._touches = {}
+        self._touch_threshold_adjustment = 0
+
+        # Define buttons and LEDs:
+        # As with touch, the DigitalInOut for a button or LED is created the first
+        # time it is used, and stored in self._digital_ios with its pin as the key.
+        self._digital_ios = {}
+        self._pixel = None
+
+        # Define audio:
+        self._mic = None
+        self._mic_profile = None
+        self._mic_rate = self._mic_level_size = self._mic_fft_size = None
+        self._mic_samples = None
+        self.mic_profile = mic_profile
+        # The speaker output is kept between tones once created. Waveform tables and their
+        # RawSamples are cached by (waveform, length) in self._waveforms, with
+        # self._waveform_keys holding the keys from least to most recently used.
+        self._audio_out = None
+        self._waveforms = {}
+        self._waveform_keys = []
+        self._tone_sample = None
+        self._melody = None
+        # WAV file playback, see play_file(). The buffer is reused for every file.
+        self._audio_file = None
+        self._audio_wave = None
+        self._audio_file_buffer = None
+        # FFT tables and work arrays, keyed by FFT size. See _spectrum().
+        self._spectra = {}
+        # Pitch detection workspace, see sound_frequency().
+        self._pitch = None
+
+        # Define sensors:
+        # Shared buffer for reading a block of sensor output registers in one transaction.
+        self._register_buffer = bytearray(12)
+        # Each sensor driver is created the first time one of its properties is used,
+        # so an app that only reads the buttons never initialises the sensors.
+        # Accelerometer/gyroscope:
+        self._accelerometer = None
+        # Magnetometer:
+        self._magnetometer = None
+        # Gesture/proximity/color/light sensor:
+        self._sensor = None
+        # Humidity sensor:
+        self._humidity = None
+        # Barometric pressure sensor:
+        self._pressure = None
+        # Cached environmental readings, see cache_policy(). self._cache_max_age maps a
+        # property name to its maximum age in seconds, and self._cache maps it to a
+        # (time.monotonic(), value) tuple of the last reading.
+        self._cache_max_age = {}
+        self._cache = {}
+        # Hardware motion events enabled by enable_motion_events().
+        self._motion_events = ()
+
+        # Create displayio object for passing.
+        self.display = board.DISPLAY
+        self._frame_pacer = None
+
+    def _get_i2c(self):
+        if self._i2c is None:
+            self._i2c = board.I2C()
+        return self._i2c
+
+    def _digital_io(
+        self, pin: Pin, output: bool = False, pull: Optional[digitalio.Pull] = digitalio.Pull.UP
+    ) -> digitalio.DigitalInOut:
+        dio = self._digital_ios.get(pin)
+        if dio is None:
+            # First time referenced. Make DigitalInOut object for the pin
+            dio = digitalio.DigitalInOut(pin)
+            if output:
+                dio.switch_to_output()
+            else:
+                dio.switch_to_input(pull=pull)
+            self._digital_ios[pin] = dio
+        return dio
+
+    # The sensor, audio and NeoPixel driver modules are imported by the getters below
+    # rather than at the top of this file, so importing adafruit_clue only loads the
+    # drivers for the features that are actually used.
+
+    def _get_accelerometer(self):
+        if self._accelerometer is None:
+            import adafruit_lsm6ds.lsm6ds3trc  # noqa: PLC0415
+            import adafruit_lsm6ds.lsm6ds33  # noqa: PLC0415
+
+            try:
+                self._accelerometer = adafruit_lsm6ds.lsm6ds33.LSM6DS33(self._get_i2c())
+            except RuntimeError:
+                self._accelerometer = adafruit_lsm6ds.lsm6ds3trc.LSM6DS3TRC(self._get_i2c())
+        return self._accelerometer
+
+    def _get_magnetometer(self):
+        if self._magnetometer is None:
+            import adafruit_lis3mdl  # noqa: PLC0415
+
+            self._magnetometer = adafruit_lis3mdl.LIS3MDL(self._get_i2c())
+        return self._magnetometer
+
+    def _get_sensor(self):
+        if self._sensor is None:
+            import adafruit_apds9960.apds9960  # noqa: PLC0415
+
+            self._sensor = adafruit_apds9960.apds9960.APDS9960(self._get_i2c())
+        return self._sensor
+
+    def _get_humidity(self):
+        if self._humidity is None:
+            import adafruit_sht31d  # noqa: PLC0415
+
+            self._humidity = adafruit_sht31d.SHT31D(self._get_i2c())
+        return self._humidity
+
+    def _get_pressure(self):
+        if self._pressure is None:
+            import adafruit_bmp280  # noqa: PLC0415
+
+            self._pressure = adafruit_bmp280.Adafruit_BMP280_I2C(self._get_i2c())
+        return self._pressure
+
+    def _read_registers(self, device, register: int, length: int) -> bytearray:
+        # Read length bytes starting at register into the shared register buffer.
+        buffer = self._register_buffer
+        buffer[0] = register
+        with device.i2c_device as i2c:
+            i2c.write_then_readinto(buffer, buffer, out_end=1, in_end=length)
+        return buffer
+
+    def _cached(self, name: str):
+        # Return the cached reading for name, or None if it is not cached or too old.
+        entry = self._cache.get(name)
+        if entry is not None and time.monotonic() - entry[0] < self._cache_max_age[name]:
+            return entry[1]
+        return None
+
+    def _cache_reading(self, name: str, value: float) -> float:
+        if name in self._cache_max_age:
+            self._cache[name] = (time.monotonic(), value)
+        return value
+
+    def _write_register(self, device, register: int, value: int):
+        buffer = self._register_buffer
+        buffer[0] = register
+        buffer[1] = value
+        with device.i2c_device as i2c:
+            i2c.write(buffer, end=2)
+
+    def _get_mic(self, sample_rate: Optional[int] = None):
+        if sample_rate is None:
+            sample_rate = self._mic_rate
+        if self._mic is not None and self._mic.sample_rate != sample_rate:
+            self._mic.deinit()
+            self._mic = None
+        if self._mic is None:
+            import audiobusio  # noqa: PLC0415
+
+            self._mic = audiobusio.PDMIn(
+                board.MICROPHONE_CLOCK,
+                board.MICROPHONE_DATA,
+                sample_rate=sample_rate,
+                bit_depth=16,
+            )
+        return self._mic
+
+    def _touch(self, pin: Pin) -> bool:
+        touchin = self._touches.get(pin)
+        if not touchin:
+            # First time referenced. Make TouchIn object for the pin
+            touchin = touchio.TouchIn(pin)
+            touchin.threshold += self._touch_threshold_adjustment
+            self._touches[pin] = touchin
+        return touchin.value
+
+    @property
+    def touch_0(self) -> bool:
+        """Detect touch on capacitive touch pad 0.
+
+        .. image :: ../docs/_static/pad_0.jpg
+          :alt: Pad 0
+
+        This example prints when pad 0 is touched.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              if clue.touch_0:
+                  print("Touched pad 0")
+        """
+        return self._touch(board.P0)
+
+    @property
+    def touch_1(self) -> bool:
+        """Detect touch on capacitive touch pad 1.
+
+        .. image :: ../docs/_static/pad_1.jpg
+          :alt: Pad 1
+
+        This example prints when pad 1 is touched.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              if clue.touch_1:
+                  print("Touched pad 1")
+        """
+        return self._touch(board.P1)
+
+    @property
+    def touch_2(self) -> bool:
+        """Detect touch on capacitive touch pad 2.
+
+        .. image :: ../docs/_static/pad_2.jpg
+          :alt: Pad 2
+
+        This example prints when pad 2 is touched.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              if clue.touch_2:
+                  print("Touched pad 2")
+        """
+        return self._touch(board.P2)
+
+    @property
+    def touch_pins(self) -> List[Pin]:
+        """A list of all the pins that are set up as touchpad inputs"""
+        return list(self._touches.keys())
+
+    @property
+    def touched(self):
+        """A list of all the pins that are currently registering a touch"""
+        return [pin for pin, touchpad in self._touches.items() if touchpad.value]
+
+    @property
+    def button_a(self) -> bool:
+        """``True`` when Button A is pressed. ``False`` if not.
+
+        .. image :: ../docs/_static/button_a.jpg
+          :alt: Button A
+
+        This example prints when button A is pressed.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              if clue.button_a:
+                  print("Button A pressed")
+        """
+        return not self._digital_io(board.BUTTON_A).value
+
+    @property
+    def button_b(self) -> bool:
+        """``True`` when Button B is pressed. ``False`` if not.
+
+        .. image :: ../docs/_static/button_b.jpg
+          :alt: Button B
+
+        This example prints when button B is pressed.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              if clue.button_b:
+                  print("Button B pressed")
+        """
+        return not self._digital_io(board.BUTTON_B).value
+
+    def motion_sampler(
+        self, rate: float = 104, size: int = 64, magnetic: bool = False
+    ) -> "_ClueMotionSampler":
+        """Sample acceleration, gyro and optionally magnetic data at a fixed rate, independent of
+        how fast the rest of the loop runs. Samples are stored in preallocated ``array("f")``
+        ring buffers, one per axis. Call ``update()`` on the returned sampler as often as
+        possible; it takes a sample whenever one is due and counts any sample times it missed in
+        ``overruns``. Use ``latest()`` for the newest sample and ``window(n)`` for the last ``n``.
+
+        :param float rate: The number of samples per second. Defaults to 104, the rate the
+                           accelerometer and gyro are configured for.
+        :param int size: The number of samples kept for each axis. Defaults to 64.
+        :param bool magnetic: Whether to sample the magnetometer as well. Defaults to ``False``.
+
+        This example prints the average x acceleration over the last 16 samples.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          sampler = clue.motion_sampler(rate=50, size=32)
+
+          while True:
+              sampler.update()
+              if sampler.count >= 16:
+                  x, y, z = sampler.window(16)
+                  print(sum(x) / 16, sampler.overruns)
+        """
+        from adafruit_clue.motion import _ClueMotionSampler  # noqa: PLC0415
+
+        return _ClueMotionSampler(self, rate, size, magnetic)
+
+    def enable_motion_events(
+        self,
+        tap: bool = False,
+        double_tap: bool = False,
+        tilt: bool = False,
+        free_fall: bool = False,
+        wake_up: bool = False,
+        significant_motion: bool = False,
+        tap_threshold: int = 9,
+        wake_up_threshold: int = 2,
+    ):
+        """Have the accelerometer detect motion events by itself, so the code does not need to
+        keep reading and processing acceleration data. The events are reported by
+        :attr:`motion_events`. Events that are not enabled here are turned off.
+
+        :param bool tap: Detect a single tap. Sets the accelerometer data rate to at least 416 Hz.
+        :param bool double_tap: Detect a double tap. Sets the accelerometer data rate to at least
+                                416 Hz.
+        :param bool tilt: Detect the board being tilted by more than 35 degrees.
+        :param bool free_fall: Detect the board falling.
+        :param bool wake_up: Detect the board starting to move.
+        :param bool significant_motion: Detect a change of location, such as walking.
+        :param int tap_threshold: Tap sensitivity from 0 to 31. Higher numbers need a harder tap.
+                                  (Default 9)
+        :param int wake_up_threshold: Wake up sensitivity from 0 to 63. Higher numbers need more
+                                      movement. (Default 2)
+
+        This example turns the NeoPixel blue on a double tap and red on free fall.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          clue.enable_motion_events(double_tap=True, free_fall=True)
+
+          while True:
+              events = clue.motion_events
+              if "double_tap" in events:
+                  clue.pixel.fill(clue.BLUE)
+              if "free_fall" in events:
+                  clue.pixel.fill(clue.RED)
+        """
+        from adafruit_clue.motion import _enable_motion_events  # noqa: PLC0415
+
+        self._motion_events = _enable_motion_events(
+            self,
+            tap,
+            double_tap,
+            tilt,
+            free_fall,
+            wake_up,
+            significant_motion,
+            tap_threshold,
+            wake_up_threshold,
+        )
+
+    @property
+    def motion_events(self) -> Tuple[str, ...]:
+        """The motion events detected since this was last read, out of those turned on with
+        :meth:`enable_motion_events`: ``"tap"``, ``"double_tap"``, ``"tilt"``, ``"free_fall"``,
+        ``"wake_up"`` and ``"significant_motion"``. Events are held by the accelerometer until
+        they are read, so an event between checks is not missed. When the accelerometer's
+        interrupt pin shows no tap, free fall or wake up event, checking costs no I2C reads.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          clue.enable_motion_events(tap=True)
+
+          while True:
+              if "tap" in clue.motion_events:
+                  print("Tap!")
+        """
+        enabled = self._motion_events
+        if not enabled:
+            return ()
+        from adafruit_clue.motion import _read_motion_events  # noqa: PLC0415
+
+        return _read_motion_events(self, enabled)
+
+    def motion_fifo(self, rate: float = 416) -> "_ClueMotionFIFO":
+        """Capture acceleration and gyro data at high rates using the accelerometer's hardware
+        FIFO. The accelerometer stores samples by itself at ``rate``, and ``read_into()`` on the
+        returned object drains all of them in one bulk I2C read, so no samples are lost as long as
+        it is called before the FIFO fills up. Call ``stop()`` to stop capturing.
+
+        :param float rate: The sample rate in Hz, one of 12.5, 26, 52, 104, 208, 416, 833 or
+                           1666, the rates both the accelerometer and gyro support. Defaults to
+                           416. The accelerometer and gyro data rates are set to match until
+                           ``stop()`` is called.
+
+        This example captures acceleration at 833 Hz and prints the z axis.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          import array
+          from adafruit_clue import clue
+
+          buffer = bytearray(12 * 64)
+          acceleration = tuple(array.array("f", [0] * 64) for _ in range(3))
+          fifo = clue.motion_fifo(rate=833)
+
+          while True:
+              count = fifo.read_into(buffer, acceleration=acceleration)
+              for i in range(count):
+                  print(acceleration[2][i])
+        """
+        from adafruit_clue.motion import _ClueMotionFIFO  # noqa: PLC0415
+
+        return _ClueMotionFIFO(self, rate)
+
+    def shake_detector(
+        self, shake_threshold: float = 30, avg_count: int = 10, latch: bool = True
+    ) -> "_ClueShakeDetector":
+        """A shake detector that does not block. Unlike :meth:`shake`, which sleeps while it takes
+        a fresh set of readings every time it is called, the detector keeps a running window of
+        the last ``avg_count`` acceleration samples. Each call to ``update()`` adds one sample and
+        returns immediately.
+
+        :param shake_threshold: Increase or decrease to change shake sensitivity. This requires a
+                                minimum value of 10, as with :meth:`shake`. (Default 30)
+        :param avg_count: The number of samples in the running average. (Default 10)
+        :param latch: If ``True``, ``shaken`` stays ``True`` after a shake until it is read, so a
+                      short shake between checks is not missed. (Default ``True``)
+
+        This example turns the NeoPixel red after the board is shaken, without slowing down the
+        loop.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          detector = clue.shake_detector()
+
+          while True:
+              detector.update()
+              if detector.shaken:
+                  clue.pixel.fill(clue.RED)
+        """
+        from adafruit_clue.motion import _ClueShakeDetector  # noqa: PLC0415
+
+        return _ClueShakeDetector(self, shake_threshold, avg_count, latch)
+
+    def shake(
+        self, shake_threshold: int = 30, avg_count: int = 10, total_delay: float = 0.1
+    ) -> bool:
+        """
+        Detect when the accelerometer is shaken. Optional parameters:
+
+        :param shake_threshold: Increase or decrease to change shake sensitivity. This
+                                requires a minimum value of 10. 10 is the total
+                                acceleration if the board is not moving, therefore
+                                anything less than 10 will erroneously report a constant
+                                shake detected. (Default 30)
+
+        :param avg_count: The number of readings taken and used for the average
+                          acceleration. (Default 10)
+
+        :param total_delay: The total time in seconds it takes to obtain avg_count
+                            readings from acceleration. (Default 0.1)
+        """
+        shake_accel = (0, 0, 0)
+        for _ in range(avg_count):
+            # shake_accel creates a list of tuples from acceleration data.
+            # zip takes multiple tuples and zips them together, as in:
+            # In : zip([-0.2, 0.0, 9.5], [37.9, 13.5, -72.8])
+            # Out: [(-0.2, 37.9), (0.0, 13.5), (9.5, -72.8)]
+            # map applies sum to each member of this tuple, resulting in a
+            # 3-member list. tuple converts this list into a tuple which is
+            # used as shake_accel.
+            shake_accel = tuple(map(sum, zip(shake_accel, self.acceleration)))
+            time.sleep(total_delay / avg_count)
+        avg = tuple(value / avg_count for value in shake_accel)
+        # Compare squared magnitudes rather than taking a square root.
+        return sum(map(lambda x: x * x, avg)) > shake_threshold * shake_threshold
+
+    async def async_shake(
+        self, shake_threshold: int = 30, avg_count: int = 10, total_delay: float = 0.1
+    ) -> bool:
+        """The same as :meth:`shake`, but lets other asyncio tasks run between readings instead
+        of sleeping. The parameters are the same as for :meth:`shake`.
+
+        .. code-block:: python
+
+          import asyncio
+          from adafruit_clue import clue
+
+          async def main():
+              while True:
+                  if await clue.async_shake():
+                      print("Shake!")
+
+          asyncio.run(main())
+        """
+        import asyncio  # noqa: PLC0415
+
+        shake_accel = (0, 0, 0)
+        for _ in range(avg_count):
+            shake_accel = tuple(map(sum, zip(shake_accel, self.acceleration)))
+            await asyncio.sleep(total_delay / avg_count)
+        avg = tuple(value / avg_count for value in shake_accel)
+        return sum(map(lambda x: x * x, avg)) > shake_threshold * shake_threshold
+
+    @property
+    def acceleration(self) -> Tuple[int, int, int]:
+        """Obtain acceleration data from the x, y and z axes.
+
+        .. image :: ../docs/_static/accelerometer.jpg
+          :alt: Accelerometer
+
+        This example prints the values. Try moving the board to see how the printed values change.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              print("Accel: {:.2f} {:.2f} {:.2f}".format(*clue.acceleration))
+        """
+        return self._get_accelerometer().acceleration
+
+    @property
+    def gyro(self) -> Tuple[int, int, int]:
+        """Obtain x, y, z angular velocity values in degrees/second.
+
+        .. image :: ../docs/_static/accelerometer.jpg
+          :alt: Gyro
+
+        This example prints the values. Try moving the board to see how the printed values change.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              print("Gyro: {:.2f} {:.2f} {:.2f}".format(*clue.gyro))
+        """
+        return self._get_accelerometer().gyro
+
+    def acceleration_into(self, buffer) -> None:
+        """Read acceleration data like :attr:`acceleration`, but store the x, y and z values in
+        the first three items of ``buffer`` instead of creating a new tuple. Reusing one buffer
+        avoids memory allocation, and the garbage collection pauses it causes, in fast loops.
+
+        :param buffer: An ``array("f")`` or list with room for at least three values.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          import array
+          from adafruit_clue import clue
+
+          acceleration = array.array("f", [0, 0, 0])
+
+          while True:
+              clue.acceleration_into(acceleration)
+              print("Accel: {:.2f} {:.2f} {:.2f}".format(*acceleration))
+        """
+        from adafruit_clue.sensors import _acceleration_into  # noqa: PLC0415
+
+        _acceleration_into(self, buffer)
+
+    def gyro_into(self, buffer) -> None:
+        """Read angular velocity like :attr:`gyro`, but store the x, y and z values in the first
+        three items of ``buffer`` instead of creating a new tuple. See :meth:`acceleration_into`.
+
+        :param buffer: An ``array("f")`` or list with room for at least three values.
+        """
+        from adafruit_clue.sensors import _gyro_into  # noqa: PLC0415
+
+        _gyro_into(self, buffer)
+
+    @property
+    def magnetic(self) -> Tuple[int, int, int]:
+        """Obtain x, y, z magnetic values in microteslas.
+
+        .. image :: ../docs/_static/magnetometer.jpg
+          :alt: Magnetometer
+
+        This example prints the values. Try moving the board to see how the printed values change.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              print("Magnetic: {:.3f} {:.3f} {:.3f}".format(*clue.magnetic))
+        """
+        return self._get_magnetometer().magnetic
+
+    def magnetic_into(self, buffer) -> None:
+        """Read magnetic data like :attr:`magnetic`, but store the x, y and z values in the first
+        three items of ``buffer`` instead of creating a new tuple. See :meth:`acceleration_into`.
+
+        :param buffer: An ``array("f")`` or list with room for at least three values.
+        """
+        from adafruit_clue.sensors import _magnetic_into  # noqa: PLC0415
+
+        _magnetic_into(self, buffer)
+
+    @property
+    def proximity(self) -> int:
+        """A relative proximity to the sensor in values from 0 - 255.
+
+        .. image :: ../docs/_static/proximity.jpg
+          :alt: Proximity sensor
+
+        This example prints the value. Try moving your hand towards and away from the front of the
+        board to see how the printed values change.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              print("Proximity: {}".format(clue.proximity))
+        """
+        sensor = self._get_sensor()
+        sensor.enable_proximity = True
+        return sensor.proximity
+
+    @property
+    def color(self) -> Tuple[int, int, int, int]:
+        """The red, green, blue, and clear light values. (r, g, b, c)
+
+        .. image :: ../docs/_static/proximity.jpg
+          :alt: Color sensor
+
+        This example prints the values. Try holding something up to the sensor to see the values
+        change. Works best with white LEDs enabled.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              print("Color: R: {} G: {} B: {} C: {}".format(*clue.color))
+        """
+        sensor = self._get_sensor()
+        sensor.enable_color = True
+        return sensor.color_data
+
+    def color_into(self, buffer) -> None:
+        """Read the light values like :attr:`color`, but store red, green, blue and clear in the
+        first four items of ``buffer`` instead of creating a new tuple. All four channels are
+        read in one I2C transaction. See :meth:`acceleration_into`.
+
+        :param buffer: An ``array("H")`` or list with room for at least four values.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          import array
+          from adafruit_clue import clue
+
+          color = array.array("H", [0, 0, 0, 0])
+
+          while True:
+              clue.color_into(color)
+              print("Color: R: {} G: {} B: {} C: {}".format(*color))
+        """
+        from adafruit_clue.sensors import _color_into  # noqa: PLC0415
+
+        _color_into(self, buffer)
+
+    @property
+    def gesture(self) -> int:
+        """A gesture code if gesture is detected. Shows ``0`` if no gesture detected.
+        ``1`` if an UP gesture is detected, ``2`` if DOWN, ``3`` if LEFT, and ``4`` if RIGHT.
+
+        .. image :: ../docs/_static/proximity.jpg
+          :alt: Gesture sensor
+
+        This example prints the gesture values. Try moving your hand up, down, left or right over
+        the sensor to see the value change.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              value = clue.gesture
+              if value:
+                  print("gesture: {}".format(value))
+        """
+        sensor = self._get_sensor()
+        sensor.enable_gesture = True
+        sensor.enable_proximity = True
+        # set rotation to match sensor orientation on CLUE
+        sensor.rotation = 270
+        return sensor.gesture()
+
+    @property
+    def humidity(self) -> float:
+        """The measured relative humidity in percent.
+
+        .. image :: ../docs/_static/humidity.jpg
+          :alt: Humidity sensor
+
+        This example prints the value. Try breathing on the sensor to see the values change.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              print("Humidity: {:.1f}%".format(clue.humidity))
+        """
+        value = self._cached("humidity")
+        if value is None:
+            value = self._cache_reading("humidity", self._get_humidity().relative_humidity)
+        return value
+
+    @property
+    def pressure(self) -> float:
+        """The barometric pressure in hectoPascals.
+
+        .. image :: ../docs/_static/pressure.jpg
+          :alt: Barometric pressure sensor
+
+        This example prints the value.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            print("Pressure: {:.3f}hPa".format(clue.pressure))
+        """
+        value = self._cached("pressure")
+        if value is None:
+            value = self._cache_reading("pressure", self._get_pressure().pressure)
+        return value
+
+    @property
+    def temperature(self) -> float:
+        """The temperature in degrees Celsius.
+
+        .. image :: ../docs/_static/pressure.jpg
+          :alt: Temperature sensor
+
+        This example prints the value. Try touching the sensor to see the value change.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            print("Temperature: {:.1f}C".format(clue.temperature))
+        """
+        value = self._cached("temperature")
+        if value is None:
+            value = self._cache_reading("temperature", self._get_pressure().temperature)
+        return value
+
+    @property
+    def altitude(self) -> float:
+        """The altitude in meters based on the sea level pressure at your location. You must set
+        ``sea_level_pressure`` to receive an accurate reading.
+
+        .. image :: ../docs/_static/pressure.jpg
+          :alt: Altitude sensor
+
+        This example prints the value. Try moving the board vertically to see the value change.
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            clue.sea_level_pressure = 1015
+
+            print("Altitude: {:.1f}m".format(clue.altitude))
+        """
+        value = self._cached("altitude")
+        if value is None:
+            value = self._cache_reading("altitude", self._get_pressure().altitude)
+        return value
+
+    @property
+    def sea_level_pressure(self) -> float:
+        """Set to the pressure at sea level at your location, before reading altitude for
+        the most accurate altitude measurement.
+
+        .. image :: ../docs/_static/pressure.jpg
+          :alt: Barometric pressure sensor
+
+        This example prints the value.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            clue.sea_level_pressure = 1015
+
+            print("Pressure: {:.3f}hPa".format(clue.pressure))
+        """
+        return self._get_pressure().sea_level_pressure
+
+    @sea_level_pressure.setter
+    def sea_level_pressure(self, value: float):
+        self._get_pressure().sea_level_pressure = value
+        # A cached altitude was calculated from the old sea level pressure.
+        self._cache.pop("altitude", None)
+
+    def cache_policy(self, **max_ages: Optional[float]):
+        """Set how long, in seconds, the environmental readings may be cached. The humidity and
+        pressure sensors are slow to read and only update a few times a second, so a loop that
+        reads them on every pass can instead reuse the last reading until it is ``max_age``
+        seconds old. Set a value to ``None`` or ``0`` to read the sensor every time, which is
+        the default.
+
+        :param max_ages: The maximum age in seconds for any of ``humidity``, ``pressure``,
+                         ``temperature`` and ``altitude``.
+
+        This example reads the humidity at most every 2 seconds and the pressure at most once a
+        second.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          clue.cache_policy(humidity=2.0, pressure=1.0)
+
+          while True:
+              print("Humidity: {:.1f}% Pressure: {:.3f}hPa".format(clue.humidity, clue.pressure))
+        """
+        for name, max_age in max_ages.items():
+            if name not in _CACHEABLE_SENSORS:
+                raise ValueError(f"Cannot cache {name}")
+            self._cache.pop(name, None)
+            if max_age:
+                self._cache_max_age[name] = max_age
+            else:
+                self._cache_max_age.pop(name, None)
+
+    def clear_cache(self, *names: str):
+        """Discard cached environmental readings so the next read comes from the sensor. See
+        :meth:`cache_policy`.
+
+        :param names: The readings to discard, any of ``"humidity"``, ``"pressure"``,
+                      ``"temperature"`` and ``"altitude"``. Discards all of them if none are given.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          clue.cache_policy(humidity=10)
+
+          while True:
+              if clue.button_a:
+                  clue.clear_cache("humidity")
+              print("Humidity: {:.1f}%".format(clue.humidity))
+        """
+        if not names:
+            self._cache.clear()
+        for name in names:
+            self._cache.pop(name, None)
+
+    def read_all(self, sensors: Optional[Tuple[str, ...]] = None) -> SensorReadings:
+        """Read several sensors in a single pass and return the results as one
+        :class:`SensorReadings` record. This is faster than reading each property in turn: the
+        acceleration and gyro data are read together in one I2C transaction, the color channels
+        are read in one transaction, and the pressure sensor is only read once for pressure,
+        temperature and altitude. Humidity, pressure, temperature and altitude follow
+        :meth:`cache_policy` as the properties do: a cached reading that is new enough is used
+        instead of reading the sensor, and a fresh reading updates the cache.
+
+        :param sensors: The names of the sensors to read, any of ``"acceleration"``, ``"gyro"``,
+                        ``"magnetic"``, ``"proximity"``, ``"color"``, ``"humidity"``,
+                        ``"pressure"``, ``"temperature"`` and ``"altitude"``. Sensors that are
+                        not requested are ``None`` in the result. Defaults to all sensors.
+
+        This example reads the motion sensors together and prints the values.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              data = clue.read_all(("acceleration", "gyro", "magnetic"))
+              print("Accel: {:.2f} {:.2f} {:.2f}".format(*data.acceleration))
+              print("Gyro: {:.2f} {:.2f} {:.2f}".format(*data.gyro))
+              print("Magnetic: {:.3f} {:.3f} {:.3f}".format(*data.magnetic))
+        """
+        from adafruit_clue.sensors import _read_all  # noqa: PLC0415
+
+        return _read_all(self, sensors)
+
+    async def async_read_all(self, sensors: Optional[Tuple[str, ...]] = None) -> SensorReadings:
+        """The same as :meth:`read_all`, but lets other asyncio tasks run between reading each
+        sensor chip.
+
+        .. code-block:: python
+
+          import asyncio
+          from adafruit_clue import clue
+
+          async def main():
+              while True:
+                  data = await clue.async_read_all(("humidity", "temperature"))
+                  print(data.humidity, data.temperature)
+                  await asyncio.sleep(1)
+
+          asyncio.run(main())
+        """
+        from adafruit_clue.sensors import _async_read_all  # noqa: PLC0415
+
+        return await _async_read_all(self, sensors)
+
+    @property
+    def white_leds(self) -> bool:
+        """The red led next to the USB plug labeled LED.
+
+        .. image :: ../docs/_static/white_leds.jpg
+          :alt: White LEDs
+
+        This example turns on the white LEDs.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            clue.white_leds = True
+        """
+        return self._digital_io(board.WHITE_LEDS, output=True).value
+
+    @white_leds.setter
+    def white_leds(self, value: bool):
+        self._digital_io(board.WHITE_LEDS, output=True).value = value
+
+    @property
+    def red_led(self) -> bool:
+        """The red led next to the USB plug labeled LED.
+
+        .. image :: ../docs/_static/red_led.jpg
+          :alt: Red LED
+
+        This example turns on the red LED.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            clue.red_led = True
+        """
+        return self._digital_io(board.L, output=True).value
+
+    @red_led.setter
+    def red_led(self, value: bool):
+        self._digital_io(board.L, output=True).value = value
+
+    @property
+    def pixel(self) -> "neopixel.NeoPixel":
+        """The NeoPixel RGB LED.
+
+        .. image :: ../docs/_static/neopixel.jpg
+          :alt: NeoPixel
+
+        This example turns the NeoPixel purple.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            while True:
+                clue.pixel.fill((255, 0, 255))
+        """
+        if self._pixel is None:
+            import neopixel  # noqa: PLC0415
+
+            self._pixel = neopixel.NeoPixel(board.NEOPIXEL, 1)
+        return self._pixel
+
+    @staticmethod
+    def _sine_sample(length: int):
+        tone_volume = (2**15) - 1
+        shift = 2**15
+        for i in range(length):
+            yield int(tone_volume * math.sin(2 * math.pi * (i / length)) + shift)
+
+    def _get_audio_out(self):
+        if self._audio_out is None:
+            import audiopwmio  # noqa: PLC0415
+
+            self._audio_out = audiopwmio.PWMAudioOut(board.SPEAKER)
+        return self._audio_out
+
+    def _waveform(self, length: int, waveform: str = "sine"):
+        # Return the cached RawSample of a waveform table of the given length, making it and
+        # evicting the least recently used table if needed.
+        key = (waveform, length)
+        sample = self._waveforms.get(key)
+        if sample is None:
+            import audiocore  # noqa: PLC0415
+
+            if waveform not in _WAVEFORMS:
+                raise ValueError(f"waveform must be one of {_WAVEFORMS}")
+            if len(self._waveform_keys) >= _WAVEFORM_CACHE_SIZE:
+                evicted = self._waveforms.pop(self._waveform_keys.pop(0))
+                if evicted is not self._tone_sample:
+                    evicted.deinit()
+            if waveform == "sine":
+                table = self._sine_sample(length)
+            else:
+                from adafruit_clue.audio import _waveform_sample  # noqa: PLC0415
+
+                table = _waveform_sample(waveform, length)
+            sample = audiocore.RawSample(array.array("H", table))
+            self._waveforms[key] = sample
+        else:
+            self._waveform_keys.remove(key)
+        self._waveform_keys.append(key)
+        return sample
+
+    def play_tone(self, frequency: int, duration: float):
+        """Produce a tone using the speaker. Try changing frequency to change
+        the pitch of the tone.
+
+        :param int frequency: The frequency of the tone in Hz
+        :param float duration: The duration of the tone in seconds
+
+        .. image :: ../docs/_static/speaker.jpg
+          :alt: Speaker
+
+        This example plays a 880 Hz tone for a duration of 1 second.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            clue.play_tone(880, 1)
+        """
+        # Play a tone of the specified frequency (hz).
+        self.start_tone(frequency)
+        time.sleep(duration)
+        self.stop_tone()
+
+    async def async_play_tone(self, frequency: int, duration: float):
+        """The same as :meth:`play_tone`, but lets other asyncio tasks run while the tone plays.
+
+        :param int frequency: The frequency of the tone in Hz
+        :param float duration: The duration of the tone in seconds
+
+        .. code-block:: python
+
+            import asyncio
+            from adafruit_clue import clue
+
+            asyncio.run(clue.async_play_tone(880, 1))
+        """
+        import asyncio  # noqa: PLC0415
+
+        self.start_tone(frequency)
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            self.stop_tone()
+
+    def start_tone(self, frequency: int, waveform: str = "sine"):
+        """Produce a tone using the speaker. Try changing frequency to change
+        the pitch of the tone. Calling this while a tone is playing starts the new tone in its
+        place, which can leave a very short gap. Calling it again with the
+        same frequency and waveform does nothing, so it is fine to call on every loop.
+
+        :param int frequency: The frequency of the tone in Hz
+        :param str waveform: The shape of the tone: ``"sine"``, ``"square"``, ``"triangle"`` or
+                             ``"sawtooth"``. Defaults to ``"sine"``.
+
+        .. image :: ../docs/_static/speaker.jpg
+          :alt: Speaker
+
+        This example plays a 523Hz tone when button A is pressed and a 587Hz tone when button B is
+        pressed, only while the buttons are being pressed.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+             from adafruit_clue import clue
+
+             while True:
+                 if clue.button_a:
+                     clue.start_tone(1600)
+                 elif clue.button_b:
+                     clue.start_tone(2000)
+                 else:
+                     clue.stop_tone()
+        """
+        length = 100
+        if length * frequency > 350000:
+            length = 350000 // frequency
+        sample = self._waveform(length, waveform)
+        sample_rate = int(length * frequency)
+        audio_out = self._get_audio_out()
+        if audio_out.playing and sample is self._tone_sample and sample.sample_rate == sample_rate:
+            # Already playing this tone.
+            return
+        # Start playing a tone of the specified frequency (hz). The sample rate is only read when
+        # playback starts, so a new frequency needs the sample to be played again.
+        self._stop_audio()
+        sample.sample_rate = sample_rate
+        audio_out.play(sample, loop=True)
+        self._tone_sample = sample
+
+    def play_melody(
+        self, notes: List[Tuple[float, float]], waveform: str = "sine", loop: bool = False
+    ) -> "_ClueMelody":
+        """Play a melody in the background, so the code keeps running while it plays. Call
+        ``tick()`` on the returned melody often, for example once each time through the main
+        loop, to move on to the next note when it is time. Alternatively run its ``run()``
+        coroutine as an asyncio task. Starting a new melody stops the current one.
+
+        :param notes: A list of ``(frequency, duration)`` tuples, with the frequency in Hz and the
+                      duration in seconds. Use a frequency of ``0`` for a rest.
+        :param str waveform: The shape of the tones: ``"sine"``, ``"square"``, ``"triangle"`` or
+                             ``"sawtooth"``. Defaults to ``"sine"``.
+        :param bool loop: Repeat the melody until it is stopped. Defaults to ``False``.
+
+        .. image :: ../docs/_static/speaker.jpg
+          :alt: Speaker
+
+        This example plays a short tune while the NeoPixel follows button A.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            melody = clue.play_melody(
+                [(523, 0.2), (587, 0.2), (659, 0.2), (0, 0.1), (784, 0.4)], waveform="triangle"
+            )
+
+            while melody.is_playing:
+                melody.tick()
+                clue.pixel.fill(clue.GREEN if clue.button_a else 0)
+        """
+        from adafruit_clue.melody import _ClueMelody  # noqa: PLC0415
+
+        if self._melody is not None:
+            self._melody.stop()
+        self._melody = _ClueMelody(self, notes, waveform, loop)
+        return self._melody
+
+    def stop_tone(self, release: bool = False):
+        """Use with start_tone to stop the tone produced.
+
+        .. image :: ../docs/_static/speaker.jpg
+          :alt: Speaker
+
+        This example plays a 523Hz tone when button A is pressed and a 587Hz tone when button B is
+        pressed, only while the buttons are being pressed.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+             from adafruit_clue import clue
+
+             while True:
+                 if clue.button_a:
+                     clue.start_tone(1600)
+                 elif clue.button_b:
+                     clue.start_tone(2000)
+                 else:
+                     clue.stop_tone()
+
+        The speaker output is kept ready for the next tone so it starts without delay. Use
+        ``release=True`` to free it instead.
+
+        :param bool release: Free the speaker output as well. Defaults to ``False``.
+        """
+        # Stop playing any tones.
+        self._stop_audio()
+        if release and self._audio_out is not None:
+            self._audio_out.deinit()
+            self._audio_out = None
+
+    def _stop_audio(self):
+        # Stop the speaker, then close any WAV file. The file must stay open until the output has
+        # stopped, because the output reads from it in the background while it plays.
+        if self._audio_out is not None and self._audio_out.playing:
+            self._audio_out.stop()
+        self._tone_sample = None
+        if self._audio_wave is not None:
+            self._audio_wave.deinit()
+            self._audio_wave = None
+        if self._audio_file is not None:
+            self._audio_file.close()
+            self._audio_file = None
+
+    def _play(self, sample, wait: bool):
+        # Play sample on the speaker. Call _stop_audio() first.
+        audio_out = self._get_audio_out()
+        audio_out.play(sample)
+        while wait and audio_out.playing:
+            pass
+
+    def play_file(self, path: str, wait: bool = False):
+        """Play a WAV file, such as an alert sound stored on the CIRCUITPY drive, on the speaker.
+        The file is streamed from flash through a small buffer that is reused for every file,
+        so it does not need to fit in RAM. Playing another sound or tone, or calling
+        :meth:`stop_tone`, stops the file straight away.
+
+        :param str path: The path to a mono or stereo 8 or 16-bit WAV file.
+        :param bool wait: Wait for the file to finish playing before returning. Defaults to
+                          ``False``.
+
+        .. image :: ../docs/_static/speaker.jpg
+          :alt: Speaker
+
+        This example plays a sound when button A is pressed, starting it again if it is pressed
+        while the sound is playing.
+
+        To use with the CLUE:
+
+        .. code-block:: python
+
+            from adafruit_clue import clue
+
+            while True:
+                if clue.button_a:
+                    clue.play_file("alert.wav")
+                    while clue.button_a:
+                        pass
+        """
+        from adafruit_clue.audio import _play_file  # noqa: PLC0415
+
+        _play_file(self, path, wait)
+
+    def play_sample(
+        self, samples, sample_rate: int = 8000, channel_count: int = 1, wait: bool = False
+    ):
+        """Play audio samples that are already in memory, such as a short sound effect made in
+        code, on the speaker. Playing another sound or tone, or calling :meth:`stop_tone`, stops
+        it straight away.
+
+        :param samples: An ``array("h")``, ``array("H")``, ``array("b")`` or ``array("B")`` of
+                        samples.
+        :param int sample_rate: The sample rate in Hz. Defaults to 8000.
+        :param int channel_count: The number of channels in ``samples``. Defaults to 1.
+        :param bool wait: Wait for the sample to finish playing before returning. Defaults to
+                          ``False``.
+
+        .. code-block:: python
+
+            import array
+            import random
+            from adafruit_clue import clue
+
+            noise = array.array("H", (random.randrange(65536) for _ in range(4000)))
+            clue.play_sample(noise, wait=True)
+        """
+        from adafruit_clue.audio import _play_sample  # noqa: PLC0415
+
+        _play_sample(self, samples, sample_rate, channel_count, wait)
+
+    @staticmethod
+    def _normalized_rms(values) -> float:
+        np = _numpy()
+        if np is not None:
+            # The standard deviation is the RMS of the samples about their mean. frombuffer
+            # uses the recorded array in place, without creating an object per sample.
+            return float(np.std(np.frombuffer(values, dtype=np.uint16)))
+        mean_values = int(sum(values) / len(values))
+        return math.sqrt(
+            sum(float(sample - mean_values) * (sample - mean_values) for sample in values)
+            / len(values)
+        )
+
+    @property
+    def mic_profile(self) -> str:
+        """The microphone profile, which sets how much sound is recorded and analysed. It can
+        also be chosen when creating a ``Clue``. Changing it frees the buffers used by the old
+        profile. The profiles are:
+
+        * ``"level_meter"``: :attr:`sound_level` records 64 samples, taking 4 milliseconds and
+          a 128 byte buffer. FFTs default to 128 points, using about 3 KB. Use this for
+          loudness-only apps that want to spend as little time and memory as possible on sound.
+        * ``"default"``: :attr:`sound_level` records 160 samples, taking 10 milliseconds and a
+          320 byte buffer. FFTs default to 256 points, using about 6 KB.
+        * ``"analysis"``: :attr:`sound_level` records 512 samples, taking 32 milliseconds and a
+          1 KB buffer, and is steadier. FFTs default to 1024 points, using about 22 KB, and give
+          16 Hz wide frequency bins instead of 62.5 Hz, but each takes about five times as long
+          to compute as a 256-point FFT.
+
+        The CLUE's nRF52840 only records 16-bit samples at 16 kHz, so every profile uses that
+        rate and depth; the profiles differ in how many samples they record and analyse. An
+        explicit ``frame_size`` or ``fft_size`` passed to a method overrides the profile.
+
+        .. code-block:: python
+
+          from adafruit_clue import Clue
+
+          clue = Clue(mic_profile="level_meter")
+
+          while True:
+              print(clue.sound_level)
+        """
+        return self._mic_profile
+
+    @mic_profile.setter
+    def mic_profile(self, profile: str):
+        if profile not in _MIC_PROFILES:
+            raise ValueError("mic_profile must be one of " + ", ".join(sorted(_MIC_PROFILES)))
+        rate, level_size, fft_size = _MIC_PROFILES[profile]
+        if level_size != self._mic_level_size:
+            self._mic_samples = None
+        if fft_size != self._mic_fft_size:
+            self._spectra = {}
+        self._mic_profile = profile
+        self._mic_rate, self._mic_level_size, self._mic_fft_size = rate, level_size, fft_size
+
+    @property
+    def sound_level(self) -> float:
+        """Obtain the sound level from the microphone (sound sensor).
+
+        .. image :: ../docs/_static/microphone.jpg
+          :alt: Microphone (sound sensor)
+
+        This example prints the sound levels. Try clapping or blowing on
+        the microphone to see the levels change.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              print(clue.sound_level)
+        """
+        if self._mic_samples is None:
+            self._mic_samples = array.array("H", [0] * self._mic_level_size)
+        self._get_mic().record(self._mic_samples, len(self._mic_samples))
+        return self._normalized_rms(self._mic_samples)
+
+    async def async_sound_level(self) -> float:
+        """The same as :attr:`sound_level`, but lets other asyncio tasks run before recording.
+        Recording a sample block itself takes about 10 milliseconds.
+
+        .. code-block:: python
+
+          import asyncio
+          from adafruit_clue import clue
+
+          async def main():
+              while True:
+                  print(await clue.async_sound_level())
+
+          asyncio.run(main())
+        """
+        import asyncio  # noqa: PLC0415
+
+        await asyncio.sleep(0)
+        return self.sound_level
+
+    def sound_onset_detector(
+        self,
+        sensitivity: float = 3.0,
+        frame_size: int = 80,
+        floor_speed: float = 0.05,
+        release: float = 0.8,
+    ) -> "_ClueSoundOnsetDetector":
+        """Detect the start of sudden sounds, such as claps or knocks, in a way that adapts to
+        the room. Unlike :meth:`loud_sound`, which compares each reading to a fixed threshold,
+        the detector keeps a running estimate of the background noise and reports a sound that
+        rises well above it. Call ``update()`` on the returned detector often; each call records
+        one short block and returns the ``time.monotonic()`` time of an onset, or ``None``.
+
+        :param float sensitivity: How many times louder than the background a sound must be.
+                                  Lower is more sensitive. Defaults to 3.
+        :param int frame_size: The number of samples in each block. Defaults to 80, which is
+                               5 milliseconds at 16 kHz.
+        :param float floor_speed: How quickly the background estimate follows changes in noise,
+                                  from 0 to 1. Defaults to 0.05.
+        :param float release: How slowly the envelope falls after a sound, from 0 to 1. A new
+                              onset is only reported once it has fallen back to the background
+                              level. Defaults to 0.8.
+
+        .. image :: ../docs/_static/microphone.jpg
+          :alt: Microphone (sound sensor)
+
+        This example counts claps.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          detector = clue.sound_onset_detector()
+
+          while True:
+              if detector.update() is not None:
+                  print("Clap", detector.onsets)
+        """
+        from adafruit_clue.microphone import _ClueSoundOnsetDetector  # noqa: PLC0415
+
+        return _ClueSoundOnsetDetector(self, sensitivity, frame_size, floor_speed, release)
+
+    def sound_stream(
+        self, frame_size: int = 160, sample_rate: Optional[int] = None, buffers: int = 2
+    ) -> "_ClueMicStream":
+        """Record the microphone as a stream of frames. Each frame is recorded into the next
+        buffer of a pool of preallocated ``array("H")`` buffers, so streaming allocates no memory
+        once started. Get frames with ``read()``, the ``frames()`` generator, or ``run(callback)``
+        on the returned stream. Audio can only be recorded while a frame is being read, so the
+        time spent between frames is counted, in whole frames, in ``dropped_frames``.
+
+        :param int frame_size: The number of samples in each frame. Defaults to 160.
+        :param int sample_rate: The sample rate in Hz. Defaults to the rate of the
+                                :attr:`mic_profile`, which is 16000, the only rate the CLUE's
+                                nRF52840 supports.
+        :param int buffers: The number of buffers in the pool. A frame stays valid until this
+                            many more frames have been read. Defaults to 2.
+
+        This example prints the peak-to-peak level of each frame and how many frames were missed.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          stream = clue.sound_stream(frame_size=256)
+
+          for frame in stream.frames():
+              print(max(frame) - min(frame), stream.dropped_frames)
+        """
+        from adafruit_clue.microphone import _ClueMicStream  # noqa: PLC0415
+
+        if sample_rate is None:
+            sample_rate = self._mic_rate
+        return _ClueMicStream(self, frame_size, sample_rate, buffers)
+
+    def record_to_file(self, path: str, seconds: float, frame_size: int = 1024, mic=None) -> int:
+        """Record the microphone to a mono 16-bit WAV file, for example to analyse a sound later
+        on a computer. Frames are recorded into two preallocated buffers in turn and each is
+        written to the file as soon as it is recorded, so any length of recording fits in RAM.
+        Audio can only be recorded while the file is not being written, so the number of frames
+        of audio missed while writing is returned. A larger ``frame_size`` means fewer writes
+        and usually fewer missed frames. Once recording has finished, the samples are converted
+        to the WAV format in the file, which takes a little longer.
+
+        The CIRCUITPY drive is read-only to code unless it is remounted in ``boot.py``, so
+        record to an SD card or remount the drive first.
+
+        :param str path: The path of the WAV file to write. It is replaced if it exists.
+        :param float seconds: The length of the recording in seconds.
+        :param int frame_size: The number of samples recorded before each write. Defaults to
+                               1024.
+        :param mic: The microphone to record from, such as an ``audiobusio.PDMIn``. Defaults to
+                    the CLUE's microphone.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          missed = clue.record_to_file("/sd/clip.wav", 3)
+          print("Missed", missed, "frames")
+        """
+        from adafruit_clue.microphone import _record_to_file  # noqa: PLC0415
+
+        return _record_to_file(self, path, seconds, frame_size, mic)
+
+    def _spectrum(self, fft_size: int) -> "_ClueSpectrum":
+        # Record fft_size samples and compute their spectrum.
+        spectrum = self._spectra.get(fft_size)
+        if spectrum is None:
+            from adafruit_clue.microphone import _ClueSpectrum  # noqa: PLC0415
+
+            spectrum = self._spectra[fft_size] = _ClueSpectrum(fft_size)
+        self._get_mic().record(spectrum.samples, fft_size)
+        spectrum.compute()
+        return spectrum
+
+    def sound_spectrum(self, bins: int = 16, fft_size: Optional[int] = None) -> array.array:
+        """Obtain the sound spectrum from the microphone, as the level of each of ``bins``
+        equally wide frequency bands from 0 Hz to half the sample rate. Levels are in the same
+        units as :attr:`sound_level`. The FFT window and twiddle factors are calculated once per
+        ``fft_size``, and the FFT uses ``ulab`` when it is available.
+
+        :param int bins: The number of frequency bands. Must be no more than ``fft_size / 2``.
+                         Defaults to 16.
+        :param int fft_size: The number of samples to record and analyse. Must be a power of two.
+                             Larger sizes give finer frequency detail but take longer. Defaults
+                             to the FFT size of the :attr:`mic_profile`, which is 256 unless
+                             changed.
+
+        The returned array is reused by the next call with the same ``bins`` and ``fft_size``.
+
+        This example draws a simple bar graph of the spectrum in the serial console.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              print(" ".join("{:4d}".format(int(level)) for level in clue.sound_spectrum(8)))
+        """
+        if fft_size is None:
+            fft_size = self._mic_fft_size
+        if not 0 < bins <= fft_size // 2:
+            raise ValueError("bins must be between 1 and fft_size / 2")
+        return self._spectrum(fft_size).levels(bins)
+
+    def band_levels(
+        self, bands: Tuple[Tuple[float, float], ...], fft_size: Optional[int] = None
+    ) -> array.array:
+        """Obtain the sound level of the microphone in each of the given frequency bands, for
+        example to trigger on a whistle but not on talking. Levels are in the same units as
+        :attr:`sound_level`. See :meth:`sound_spectrum`.
+
+        :param bands: A sequence of ``(low, high)`` frequencies in Hz.
+        :param int fft_size: The number of samples to record and analyse. Must be a power of two.
+                             Defaults to the FFT size of the :attr:`mic_profile`.
+
+        The returned array is reused by the next call with the same number of bands and
+        ``fft_size``.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              bass, whistle = clue.band_levels(((60, 250), (1000, 3000)))
+              if whistle > 3 * bass:
+                  print("Whistle!")
+        """
+        if fft_size is None:
+            fft_size = self._mic_fft_size
+        spectrum = self._spectrum(fft_size)
+        return spectrum.band_levels(bands, self._get_mic().sample_rate / fft_size)
+
+    def sound_frequency(
+        self, min_frequency: float = 80, max_frequency: float = 1000, threshold: float = 0.15
+    ) -> Tuple[float, float]:
+        """Estimate the main frequency, or pitch, of the sound at the microphone, for example to
+        make a tuner or respond to a whistle. Returns a ``(frequency, confidence)`` tuple, where
+        ``frequency`` is in Hz and ``confidence`` is from 0 to 1. A clear note gives a confidence
+        close to 1, while noise or silence gives a low confidence and a meaningless frequency.
+
+        This uses the YIN algorithm on samples averaged down to about eight times
+        ``max_frequency``, in a workspace that is reused from call to call. Narrowing the range
+        of frequencies makes it faster.
+
+        :param float min_frequency: The lowest frequency to detect in Hz. Defaults to 80.
+        :param float max_frequency: The highest frequency to detect in Hz. Defaults to 1000.
+        :param float threshold: How closely the sound must repeat to be taken as a pitch, from 0
+                                to 1. Lower is stricter. Defaults to 0.15.
+
+        This example prints the pitch of any clear note.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              frequency, confidence = clue.sound_frequency()
+              if confidence > 0.8:
+                  print("{:.1f} Hz".format(frequency))
+        """
+        mic = self._get_mic()
+        factor = max(1, int(mic.sample_rate // (8 * max_frequency)))
+        decimated_rate = mic.sample_rate / factor
+        tau_min = max(2, int(decimated_rate / max_frequency) - 1)
+        tau_max = int(decimated_rate / min_frequency) + 1
+        if tau_min >= tau_max:
+            raise ValueError("min_frequency must be lower than max_frequency")
+        pitch = self._pitch
+        if pitch is None or pitch.factor != factor or pitch.tau_max != tau_max:
+            from adafruit_clue.microphone import _CluePitch  # noqa: PLC0415
+
+            pitch = self._pitch = _CluePitch(factor, tau_max)
+        mic.record(pitch.samples, len(pitch.samples))
+        return pitch.estimate(mic.sample_rate, tau_min, threshold)
+
+    def loud_sound(self, sound_threshold: int = 200) -> bool:
+        """Utilise a loud sound as an input.
+
+        :param int sound_threshold: Threshold sound level must exceed to return true (Default: 200)
+
+        .. image :: ../docs/_static/microphone.jpg
+          :alt: Microphone (sound sensor)
+
+        This example turns the NeoPixel LED blue each time you make a loud sound.
+        Try clapping or blowing onto the microphone to trigger it.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              if clue.loud_sound():
+                  clue.pixel.fill((0, 50, 0))
+              else:
+                  clue.pixel.fill(0)
+
+        You may find that the code is not responding how you would like.
+        If this is the case, you can change the loud sound threshold to
+        make it more or less responsive. Setting it to a higher number
+        means it will take a louder sound to trigger. Setting it to a
+        lower number will take a quieter sound to trigger. The following
+        example shows the threshold being set to a higher number than
+        the default.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          while True:
+              if clue.loud_sound(sound_threshold=300):
+                  clue.pixel.fill((0, 50, 0))
+              else:
+                  clue.pixel.fill(0)
+        """
+
+        return self.sound_level > sound_threshold
+
+    def display_frame(self, fps: float = 30) -> "_ClueFramePacer":
+        """Draw display changes one whole frame at a time. Normally the display refreshes on its
+        own whenever something changes, so a loop that changes several lines of text can draw
+        them part way through, and spends time drawing frames that are replaced straight away.
+        The returned frame pacer turns automatic refresh off and draws everything changed in a
+        ``with`` block in a single refresh at the end, at no more than ``fps`` frames per second.
+        When the loop falls behind, frames are dropped rather than slowing it down further.
+
+        The pacer counts ``frames`` drawn and ``dropped_frames``, and reports the
+        ``achieved_fps`` over the last second and the ``refresh_time``, ``max_refresh_time`` and
+        ``average_refresh_time`` in seconds. Call ``stop()`` on it to turn automatic refresh
+        back on. The same pacer is returned every time, so it is fine to call this in the loop.
+
+        :param float fps: The target frame rate. Defaults to 30.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          clue_data = clue.simple_text_display(title="CLUE Sensor Data!")
+          clue_data.show()
+
+          while True:
+              with clue.display_frame(fps=20) as frame:
+                  clue_data[0].text = "Accel: {:.2f} {:.2f} {:.2f}".format(*clue.acceleration)
+                  clue_data[1].text = "Gyro: {:.2f} {:.2f} {:.2f}".format(*clue.gyro)
+                  clue_data[3].text = "{:.1f} FPS".format(frame.achieved_fps)
+        """
+        if self._frame_pacer is None:
+            from adafruit_clue.graphics import _ClueFramePacer  # noqa: PLC0415
+
+            self._frame_pacer = _ClueFramePacer(self.display, fps)
+        self._frame_pacer.fps = fps
+        return self._frame_pacer
+
+    @staticmethod
+    def simple_text_display(
+        title: Optional[str] = None,
+        title_color: Tuple = (255, 255, 255),
+        title_scale: int = 1,
+        text_scale: int = 1,
+        font: Optional[str] = None,
+        colors: Optional[Tuple[Tuple[int, int, int], ...]] = None,
+        fast_text: bool = False,
+        scrolling: bool = False,
+        history: int = 100,
+    ):
+        """Display lines of text on the CLUE display. Lines of text are created in order as shown
+        in the example below. If you skip a number, the line will be shown blank on the display,
+        e.g. if you include ``[0]`` and ``[2]``, the second line on the display will be empty, and
+        the text specified for lines 0 and 2 will be displayed on the first and third line.
+        Remember, Python begins counting at 0, so the first line on the display is 0 in the code.
+
+        Setup occurs before the loop. For data to be dynamically updated on the display, you must
+        include the data call in the loop by using ``.text =``. For example, if setup is saved as
+        ``clue_data = simple_text_display()`` then ``clue_data[0].text = clue.proximity`` must be
+        inside the ``while True:`` loop for the proximity data displayed to update as the
+        values change. You must call ``show()`` at the end of the list for anything to display.
+        See example below for usage. Lines are only redrawn when their text or color changes,
+        so it is cheap to set every line on every loop, and ``redrawn`` holds the number of
+        lines that changed before the last ``show()``.
+
+        :param str title: The title displayed above the data. Set ``title="Title text"`` to provide
+                          a title. Defaults to None.
+        :param title_color: The color of the title. Not necessary if no title is provided. Defaults
+                            to white (255, 255, 255).
+        :param int title_scale: Scale the size of the title. Not necessary if no title is provided.
+                                Defaults to 1.
+        :param int text_scale: Scale the size of the data lines. Scales the title as well.
+                               Defaults to 1.
+        :param str font: The font to use to display the title and data. Defaults to built in
+                     ``terminalio.FONT``.
+        :param colors: A list of colors for the lines of data on the display. If you provide a
+                       single color, all lines will be that color. Otherwise it will cycle through
+                       the list you provide if the list is less than the number of lines displayed.
+                       Default colors are used if ``colors`` is not set. For example, if creating
+                       two lines of data, ``colors=((255, 255, 255), (255, 0, 0))`` would set the
+                       first line white and the second line red, and if you created four lines of
+                       data with the same setup, it would alternate white and red.
+        :param bool fast_text: Draw the lines, but not the title, straight from the font's glyph
+                               bitmap instead of with ``adafruit_display_text`` labels. Changing
+                               the text then only redraws the characters that changed, and each
+                               line uses less RAM. Lines are a single row of text cut off at the
+                               edge of the display. Needs a built-in font such as the default
+                               ``terminalio.FONT``. Defaults to ``False``.
+        :param bool scrolling: Show a scrolling log instead of numbered lines. Enough lines to
+                               fill the display are created up front, and ``log(text)`` adds a
+                               line at the bottom, moving the others up and reusing the top one
+                               once the display is full, so memory use does not grow. Indexing
+                               gives the lines from top to bottom. Defaults to ``False``.
+        :param int history: In scrolling mode, the number of logged lines kept for scrolling back
+                            with ``scroll_offset``. Defaults to 100.
+
+        .. image :: ../docs/_static/display_clue_data.jpg
+          :alt: Display Clue Data demo
+
+        This example displays three lines with acceleration, gyro and magnetic data on the display.
+        Remember to call ``show()`` after the list to update the display.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          clue_data = clue.simple_text_display(title="CLUE Sensor Data!", title_scale=2)
+
+          while True:
+              clue_data[0].text = "Acceleration: {:.2f} {:.2f} {:.2f}".format(*clue.acceleration)
+              clue_data[1].text = "Gyro: {:.2f} {:.2f} {:.2f}".format(*clue.gyro)
+              clue_data[2].text = "Magnetic: {:.3f} {:.3f} {:.3f}".format(*clue.magnetic)
+              clue_data.show()
+
+        This example logs button presses, scrolling the log back while touch pad 0 is touched.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          clue_log = clue.simple_text_display(title="Log", scrolling=True)
+          clue_log.show()
+
+          while True:
+              if clue.button_a:
+                  clue_log.log("Button A pressed")
+                  while clue.button_a:
+                      pass
+              clue_log.scroll_offset = 5 if clue.touch_0 else 0
+        """
+        from adafruit_clue.text import _ClueSimpleTextDisplay  # noqa: PLC0415
+
+        return _ClueSimpleTextDisplay(
+            title=title,
+            title_color=title_color,
+            title_scale=title_scale,
+            text_scale=text_scale,
+            font=font,
+            colors=colors,
+            fast_text=fast_text,
+            scrolling=scrolling,
+            history=history,
+        )
+
+    @staticmethod
+    def strip_chart(
+        width: int = 240,
+        height: int = 120,
+        traces: int = 1,
+        colors: Optional[Tuple[Union[int, Tuple[int, int, int]], ...]] = None,
+        minimum: Optional[float] = None,
+        maximum: Optional[float] = None,
+    ) -> "_ClueStripChart":
+        """Plot one or more values over time, such as acceleration, sound level or pressure. The
+        chart is a single indexed ``displayio.Bitmap`` with one column per sample. Samples are
+        drawn from left to right, and once the chart is full each new sample replaces the oldest
+        one, so adding a sample only erases and draws at most two columns. Add the chart's
+        ``group`` to the group being displayed, and call ``add()`` with one value per trace for
+        each sample.
+
+        If ``minimum`` or ``maximum`` are not given, the chart scales itself to fit the samples.
+        It only redraws everything when the range changes: when a sample falls outside it, or
+        once per pass across the chart when the samples only use a small part of it.
+
+        :param int width: The width of the chart in pixels, which is also the number of samples
+                          shown. Defaults to 240.
+        :param int height: The height of the chart in pixels. Defaults to 120.
+        :param int traces: The number of values plotted for each sample. Defaults to 1.
+        :param colors: The color of each trace. Defaults to :attr:`Clue.RAINBOW`.
+        :param float minimum: The value at the bottom of the chart. Defaults to scaling to fit.
+        :param float maximum: The value at the top of the chart. Defaults to scaling to fit.
+
+        This example plots the acceleration on each axis.
+
+        .. code-block:: python
+
+          from adafruit_clue import clue
+
+          chart = clue.strip_chart(traces=3)
+          clue.display.root_group = chart.group
+
+          while True:
+              chart.add(*clue.acceleration)
+        """
+        from adafruit_clue.graphics import _ClueStripChart  # noqa: PLC0415
+
+        return _ClueStripChart(width, height, traces, colors or Clue.RAINBOW, minimum, maximum)
+
+
+clue = Clue()
+"""Object that is automatically created on import. Creating it does no hardware work: the
+   sensors, microphone, speaker, buttons and LEDs are each set up the first time they are used.
+
+   To use, simply import it from the module:
+
+   .. code-block:: python
+
+     from adafruit_clue import clue
+"""
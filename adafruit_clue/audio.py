@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_clue.audio`
+================================================================================
+
+Playing WAV files and samples, and the square, triangle and sawtooth tone waveforms, for
+:class:`adafruit_clue.Clue`. Imported the first time one of these is used.
+"""
+
+import audiocore
+
+from adafruit_clue import Clue
+
+
+def _square_sample(length: int):
+    tone_volume = (2**15) - 1
+    shift = 2**15
+    for i in range(length):
+        yield shift + tone_volume if i < length // 2 else shift - tone_volume
+
+
+def _triangle_sample(length: int):
+    tone_volume = (2**15) - 1
+    shift = 2**15
+    for i in range(length):
+        # Rise from the middle to the top, down to the bottom, then back to the middle.
+        phase = (i / length + 0.25) % 1
+        yield int(tone_volume * (1 - 4 * abs(phase - 0.5)) + shift)
+
+
+def _sawtooth_sample(length: int):
+    tone_volume = (2**15) - 1
+    shift = 2**15
+    for i in range(length):
+        yield int(tone_volume * (2 * i / length - 1) + shift)
+
+
+def _waveform_sample(waveform: str, length: int):
+    """Generate ``length`` samples of one cycle of the ``waveform`` for :meth:`Clue.start_tone`."""
+    if waveform == "square":
+        return _square_sample(length)
+    if waveform == "triangle":
+        return _triangle_sample(length)
+    return _sawtooth_sample(length)
+
+
+def _play_file(clue: "Clue", path: str, wait: bool):
+    """Play a WAV file for :meth:`Clue.play_file`."""
+    if clue._audio_file_buffer is None:
+        clue._audio_file_buffer = bytearray(1024)
+    clue._stop_audio()
+    clue._audio_file = open(path, "rb")
+    clue._audio_wave = audiocore.WaveFile(clue._audio_file, clue._audio_file_buffer)
+    clue._play(clue._audio_wave, wait)
+
+
+def _play_sample(clue: "Clue", samples, sample_rate: int, channel_count: int, wait: bool):
+    """Play samples for :meth:`Clue.play_sample`."""
+    clue._stop_audio()
+    clue._play(
+        audiocore.RawSample(samples, channel_count=channel_count, sample_rate=sample_rate),
+        wait,
+    )
@@ -0,0 +1,219 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_clue.graphics`
+================================================================================
+
+The strip chart and frame pacer returned by :class:`adafruit_clue.Clue`, imported the first
+time one of them is made.
+"""
+
+try:
+    from typing import Optional, Tuple, Union
+except ImportError:
+    pass
+
+import array
+import time
+
+import displayio
+
+
+class _ClueStripChart:
+    """A chart of one or more values over time, drawn one column per sample."""
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        traces: int,
+        colors: Tuple[Union[int, Tuple[int, int, int]], ...],
+        minimum: Optional[float],
+        maximum: Optional[float],
+    ):
+        if not 0 < traces < 255:
+            raise ValueError("traces must be between 1 and 254")
+        if minimum is not None and maximum is not None and minimum >= maximum:
+            raise ValueError("minimum must be less than maximum")
+        self.width = width
+        self.height = height
+        self._bitmap = displayio.Bitmap(width, height, traces + 1)
+        palette = displayio.Palette(traces + 1)
+        palette[0] = 0x000000
+        for trace in range(traces):
+            palette[trace + 1] = colors[trace % len(colors)]
+        self.group = displayio.Group()
+        """The ``displayio.Group`` holding the chart. Add it to the group being displayed."""
+        self.group.append(displayio.TileGrid(self._bitmap, pixel_shader=palette))
+        self._history = tuple(array.array("f", [0] * width) for _ in range(traces))
+        # The rows drawn in each column, so a column can be erased without clearing all of it.
+        self._top = array.array("H", [height] * width)
+        self._bottom = array.array("H", [0] * width)
+        # The column the next sample is drawn in, and how many columns hold samples.
+        self._column = 0
+        self._count = 0
+        self._fixed_minimum = minimum
+        self._fixed_maximum = maximum
+        self.minimum = 0.0 if minimum is None else minimum
+        """The value at the bottom of the chart."""
+        self.maximum = 1.0 if maximum is None else maximum
+        """The value at the top of the chart."""
+        self.redraws = 0
+        """The number of times the whole chart has been redrawn because its range changed."""
+
+    def add(self, *values: float):
+        """Add one sample for each trace, replacing the oldest sample once the chart is full.
+        Only the sample's column, and once the chart is full the column of the new oldest
+        sample, are erased and drawn, unless the sample is outside the range of an automatically
+        scaled chart, in which case the range grows and the whole chart is redrawn."""
+        if len(values) != len(self._history):
+            raise ValueError(f"Expected {len(self._history)} values, one for each trace")
+        column = self._column
+        for trace, value in enumerate(values):
+            self._history[trace][column] = value
+        self._count = min(self._count + 1, self.width)
+        self._column = (column + 1) % self.width
+        if self._rescale(values, self._column == 0):
+            self._redraw()
+        else:
+            self._draw_column(column)
+            if self._count == self.width:
+                # The next column now holds the oldest sample, which is not joined to the
+                # sample just overwritten.
+                self._draw_column(self._column)
+
+    def _fitted_range(self, low: float, high: float) -> Tuple[float, float]:
+        # Pad the range by a tenth each way, so a slowly growing value does not redraw the
+        # chart on every sample.
+        pad = (high - low) / 10 or 1
+        low = low - pad if self._fixed_minimum is None else self._fixed_minimum
+        high = high + pad if self._fixed_maximum is None else self._fixed_maximum
+        return low, high
+
+    def _rescale(self, values: Tuple[float, ...], wrapped: bool) -> bool:
+        if self._fixed_minimum is not None and self._fixed_maximum is not None:
+            return False
+        outside = min(values) < self.minimum or max(values) > self.maximum
+        # Fit the range to the samples on the chart when a sample falls outside it, and once per
+        # pass across the chart so that it also shrinks when the values settle down.
+        if not (outside or wrapped or self._count == 1):
+            return False
+        low = min(min(history[: self._count]) for history in self._history)
+        high = max(max(history[: self._count]) for history in self._history)
+        if not outside and self._count > 1:
+            # Only shrink when the samples use less than half the range.
+            if (high - low) * 2 > self.maximum - self.minimum:
+                return False
+        low, high = self._fitted_range(low, high)
+        if (low, high) == (self.minimum, self.maximum):
+            return False
+        self.minimum, self.maximum = low, high
+        return True
+
+    def _row(self, value: float) -> int:
+        row = int((self.maximum - value) * (self.height - 1) / (self.maximum - self.minimum) + 0.5)
+        return min(self.height - 1, max(0, row))
+
+    def _draw_column(self, column: int):
+        bitmap = self._bitmap
+        for row in range(self._top[column], self._bottom[column] + 1):
+            bitmap[column, row] = 0
+        top = self.height
+        bottom = 0
+        # The oldest sample on the chart is not joined to the newest one before it.
+        oldest = self._column if self._count == self.width else 0
+        joined = column != oldest
+        previous = (column - 1) % self.width
+        for trace, history in enumerate(self._history):
+            row = self._row(history[column])
+            start = end = row
+            if joined:
+                previous_row = self._row(history[previous])
+                # Join to the previous sample with a vertical line, ending halfway between the
+                # two rows so steps do not overlap the previous column.
+                if previous_row < row:
+                    start = (previous_row + row + 1) // 2
+                elif previous_row > row:
+                    end = (previous_row + row) // 2
+            for y in range(start, end + 1):
+                bitmap[column, y] = trace + 1
+            top = min(top, start)
+            bottom = max(bottom, end)
+        self._top[column] = top
+        self._bottom[column] = bottom
+
+    def _redraw(self):
+        self.redraws += 1
+        self._bitmap.fill(0)
+        for column in range(self.width):
+            self._top[column] = self.height
+            self._bottom[column] = 0
+        for column in range(self._count):
+            self._draw_column(column)
+
+
+class _ClueFramePacer:
+    """Batch display changes into one refresh per frame at a steady frame rate."""
+
+    def __init__(self, display, fps: float):
+        self._display = display
+        self.fps = fps
+        """The target frame rate."""
+        self.frames = 0
+        """The number of frames drawn."""
+        self.dropped_frames = 0
+        """The number of frames skipped because the loop fell behind the target frame rate."""
+        self.achieved_fps = 0.0
+        """The number of frames drawn in the last whole second."""
+        self.refresh_time = 0.0
+        """How long the last refresh took in seconds, including any wait for the frame time."""
+        self.max_refresh_time = 0.0
+        """The longest refresh so far in seconds."""
+        self._total_refresh_ns = 0
+        self._second_start_ns = None
+        self._second_frames = 0
+
+    @property
+    def average_refresh_time(self) -> float:
+        """The average refresh time of the frames drawn so far in seconds."""
+        return self._total_refresh_ns / self.frames / 1e9 if self.frames else 0.0
+
+    def __enter__(self):
+        self._display.auto_refresh = False
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        if exception_type is None:
+            self.refresh()
+
+    def refresh(self) -> bool:
+        """Draw the changes made since the last frame, waiting for the next frame time first if
+        the loop is ahead. Returns ``False`` and draws nothing if the loop has fallen behind."""
+        self._display.auto_refresh = False
+        start = time.monotonic_ns()
+        if self._second_start_ns is None:
+            self._second_start_ns = start
+        drawn = self._display.refresh(
+            target_frames_per_second=self.fps, minimum_frames_per_second=0
+        )
+        now = time.monotonic_ns()
+        if drawn:
+            self.frames += 1
+            self._second_frames += 1
+            elapsed = now - start
+            self._total_refresh_ns += elapsed
+            self.refresh_time = elapsed / 1e9
+            self.max_refresh_time = max(self.max_refresh_time, self.refresh_time)
+        else:
+            self.dropped_frames += 1
+        if now - self._second_start_ns >= 1_000_000_000:
+            self.achieved_fps = self._second_frames * 1e9 / (now - self._second_start_ns)
+            self._second_start_ns = now
+            self._second_frames = 0
+        return drawn
+
+    def stop(self):
+        """Turn the display's automatic refresh back on."""
+        self._display.auto_refresh = True
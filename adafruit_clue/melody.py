@@ -0,0 +1,80 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_clue.melody`
+================================================================================
+
+The background melody player returned by :meth:`adafruit_clue.Clue.play_melody`, imported
+the first time a melody is played.
+"""
+
+try:
+    from typing import List, Tuple
+except ImportError:
+    pass
+
+import time
+
+from adafruit_clue import Clue
+
+
+class _ClueMelody:
+    """Play a list of notes in the background."""
+
+    def __init__(self, clue: "Clue", notes: List[Tuple[float, float]], waveform: str, loop: bool):
+        for _, duration in notes:
+            if duration <= 0:
+                raise ValueError("Note durations must be greater than 0")
+        self._clue = clue
+        self._notes = notes
+        self._waveform = waveform
+        self._loop = loop
+        self._index = 0
+        self._note_end_ns = 0
+        if notes:
+            self._start_note(time.monotonic_ns())
+        else:
+            self._index = None
+
+    def _start_note(self, start_ns: int):
+        frequency, duration = self._notes[self._index]
+        if frequency:
+            self._clue.start_tone(frequency, self._waveform)
+        else:
+            self._clue.stop_tone()
+        # Time each note from the end of the last so the tempo does not drift.
+        self._note_end_ns = start_ns + int(duration * 1_000_000_000)
+
+    @property
+    def is_playing(self) -> bool:
+        """``True`` until the melody has finished or been stopped."""
+        return self._index is not None
+
+    def tick(self) -> bool:
+        """Move on to the next note if it is time. Returns `is_playing`."""
+        if self._index is None:
+            return False
+        while time.monotonic_ns() >= self._note_end_ns:
+            self._index += 1
+            if self._index >= len(self._notes):
+                if not self._loop:
+                    self.stop()
+                    return False
+                self._index = 0
+            self._start_note(self._note_end_ns)
+        return True
+
+    async def run(self):
+        """Play the melody in an asyncio task until it finishes or is stopped."""
+        import asyncio  # noqa: PLC0415
+
+        while self.tick():
+            await asyncio.sleep(max(0, self._note_end_ns - time.monotonic_ns()) / 1_000_000_000)
+
+    def stop(self):
+        """Stop the melody."""
+        if self._index is not None:
+            self._index = None
+            self._clue.stop_tone()
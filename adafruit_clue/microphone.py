@@ -0,0 +1,405 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_clue.microphone`
+================================================================================
+
+Microphone streaming, spectrum, pitch and onset detection for :class:`adafruit_clue.Clue`,
+imported the first time one of them is used.
+"""
+
+try:
+    from typing import Optional, Tuple
+except ImportError:
+    pass
+
+import array
+import math
+import struct
+import time
+
+from adafruit_clue import Clue, _numpy
+
+
+class _ClueMicStream:
+    """Record the microphone frame after frame into a pool of reusable buffers."""
+
+    def __init__(self, clue: "Clue", frame_size: int, sample_rate: int, buffers: int, mic=None):
+        self._clue = clue
+        self._mic = mic
+        self.frame_size = frame_size
+        """The number of samples in each frame."""
+        self.sample_rate = sample_rate
+        """The sample rate in Hz."""
+        self._frame_ns = frame_size * 1_000_000_000 // sample_rate
+        self._pool = tuple(array.array("H", [0] * frame_size) for _ in range(buffers))
+        self._index = 0
+        self._recorded_ns = None
+        self.frames_recorded = 0
+        """The number of frames recorded."""
+        self.dropped_frames = 0
+        """The number of frames of audio missed because the next frame was not read in time."""
+
+    def read(self) -> array.array:
+        """Record the next frame into the next buffer in the pool and return it. The buffer is
+        reused, and overwritten, once every buffer in the pool has been used."""
+        mic = self._mic or self._clue._get_mic(self.sample_rate)
+        if self._recorded_ns is not None:
+            # The microphone is only recorded while record() runs, so any time spent between
+            # frames is audio that was missed.
+            self.dropped_frames += (time.monotonic_ns() - self._recorded_ns) // self._frame_ns
+        buffer = self._pool[self._index]
+        mic.record(buffer, self.frame_size)
+        self._recorded_ns = time.monotonic_ns()
+        self._index = (self._index + 1) % len(self._pool)
+        self.frames_recorded += 1
+        return buffer
+
+    def frames(self, count: Optional[int] = None):
+        """A generator that records and yields ``count`` frames, or frames forever if ``count``
+        is ``None``."""
+        while count is None or count > 0:
+            yield self.read()
+            if count is not None:
+                count -= 1
+
+    def run(self, callback, count: Optional[int] = None):
+        """Record ``count`` frames, or frames forever if ``count`` is ``None``, and pass each one
+        to ``callback``."""
+        for frame in self.frames(count):
+            callback(frame)
+
+
+class _ClueSpectrum:
+    """Precomputed tables and work arrays for a microphone FFT of one size."""
+
+    def __init__(self, size: int):
+        if size < 4 or size & (size - 1):
+            raise ValueError("fft_size must be a power of two")
+        self.size = size
+        half = size // 2
+        self.samples = array.array("H", [0] * size)
+        # Hann window, and the scale that turns FFT magnitudes into RMS levels, so that the
+        # root-sum-square of the bins is the RMS level of the samples, as sound_level reads it.
+        self._window = array.array(
+            "f", (0.5 - 0.5 * math.cos(2 * math.pi * i / (size - 1)) for i in range(size))
+        )
+        self._scale = math.sqrt(2 / (size * sum(w * w for w in self._window)))
+        self.magnitudes = array.array("f", [0] * half)
+        self._outputs = {}
+        self._np = np = _numpy()
+        if np is not None:
+            self._np_window = np.array(self._window)
+        else:
+            self._cos = array.array("f", (math.cos(2 * math.pi * i / size) for i in range(half)))
+            self._sin = array.array("f", (math.sin(2 * math.pi * i / size) for i in range(half)))
+            self._bit_reverse = array.array("H", (self._reverse_bits(i, size) for i in range(size)))
+            self._real = array.array("f", [0] * size)
+            self._imag = array.array("f", [0] * size)
+
+    @staticmethod
+    def _reverse_bits(value: int, size: int) -> int:
+        # Reverse the order of the log2(size) low bits of value.
+        result = 0
+        while size > 1:
+            result = (result << 1) | (value & 1)
+            value >>= 1
+            size >>= 1
+        return result
+
+    def output(self, length: int) -> array.array:
+        """A reusable output array of the given length."""
+        out = self._outputs.get(length)
+        if out is None:
+            out = self._outputs[length] = array.array("f", [0] * length)
+        return out
+
+    def levels(self, bins: int) -> array.array:
+        """The level of each of ``bins`` equally wide frequency bands, for
+        :meth:`Clue.sound_spectrum`."""
+        magnitudes = self.magnitudes
+        levels = self.output(bins)
+        group = len(magnitudes) // bins
+        for band in range(bins):
+            power = 0
+            # Skip bin 0, which only holds whatever DC offset is left after removing the mean.
+            for i in range(max(1, band * group), band * group + group):
+                power += magnitudes[i] * magnitudes[i]
+            levels[band] = math.sqrt(power)
+        return levels
+
+    def band_levels(self, bands: Tuple[Tuple[float, float], ...], bin_width: float) -> array.array:
+        """The level of each ``(low, high)`` frequency band, for :meth:`Clue.band_levels`."""
+        magnitudes = self.magnitudes
+        levels = self.output(len(bands))
+        for band, (low, high) in enumerate(bands):
+            power = 0
+            # Skip bin 0 here too.
+            for i in range(
+                max(1, int(low / bin_width + 0.5)),
+                min(len(magnitudes), int(high / bin_width + 0.5) + 1),
+            ):
+                power += magnitudes[i] * magnitudes[i]
+            levels[band] = math.sqrt(power)
+        return levels
+
+    def compute(self):
+        """Fill ``magnitudes`` with the RMS level of each frequency bin in ``samples``."""
+        magnitudes = self.magnitudes
+        np = self._np
+        if np is None:
+            self._fft()
+            real = self._real
+            imag = self._imag
+            for i in range(len(magnitudes)):
+                magnitudes[i] = math.sqrt(real[i] * real[i] + imag[i] * imag[i]) * self._scale
+            return
+        samples = np.frombuffer(self.samples, dtype=np.uint16)
+        result = np.fft.fft((samples - np.mean(samples)) * self._np_window)
+        if isinstance(result, tuple):
+            # ulab without complex number support returns the real and imaginary parts.
+            real, imag = result
+            amplitudes = np.sqrt(real * real + imag * imag)
+        else:
+            amplitudes = abs(result)
+        amplitudes *= self._scale
+        for i in range(len(magnitudes)):
+            magnitudes[i] = amplitudes[i]
+
+    def _fft(self):
+        # The pure Python FFT of the windowed samples into _real and _imag, for when neither
+        # ulab nor NumPy is available.
+        size = self.size
+        samples = self.samples
+        window = self._window
+        real = self._real
+        imag = self._imag
+        bit_reverse = self._bit_reverse
+        mean = sum(samples) / size
+        for i in range(size):
+            real[bit_reverse[i]] = (samples[i] - mean) * window[i]
+            imag[i] = 0
+        # Iterative radix-2 FFT using the precomputed twiddle factors.
+        span = 1
+        while span < size:
+            stride = size // (span * 2)
+            for start in range(0, size, span * 2):
+                for k in range(span):
+                    w_real = self._cos[k * stride]
+                    w_imag = -self._sin[k * stride]
+                    i = start + k
+                    j = i + span
+                    t_real = w_real * real[j] - w_imag * imag[j]
+                    t_imag = w_real * imag[j] + w_imag * real[j]
+                    real[j] = real[i] - t_real
+                    imag[j] = imag[i] - t_imag
+                    real[i] += t_real
+                    imag[i] += t_imag
+            span *= 2
+
+
+class _CluePitch:
+    """Preallocated workspace for YIN pitch detection on decimated microphone samples."""
+
+    def __init__(self, factor: int, tau_max: int):
+        self.factor = factor
+        self.tau_max = tau_max
+        # Twice the longest period: the window compared at each lag is at least one period.
+        self._window = tau_max + 2
+        self.samples = array.array("H", [0] * ((self._window + tau_max) * factor))
+        self._difference = array.array("f", [0] * (tau_max + 1))
+        self._np = np = _numpy()
+        if np is not None:
+            # The decimated signal, and the differences at one lag, kept as ndarrays so the
+            # difference function does not copy the signal or make temporaries.
+            self._signal = np.zeros(self._window + tau_max)
+            self._delta = np.zeros(self._window)
+        else:
+            self._signal = array.array("f", [0] * (self._window + tau_max))
+
+    def _decimate(self):
+        # Average each group of factor samples, which also filters out high frequencies.
+        samples = self.samples
+        signal = self._signal
+        factor = self.factor
+        for i in range(len(signal)):
+            total = 0
+            for j in range(i * factor, i * factor + factor):
+                total += samples[j]
+            signal[i] = total / factor
+
+    def _difference_function(self):
+        # YIN difference function: the squared difference between the signal and itself
+        # delayed by each lag.
+        signal = self._signal
+        difference = self._difference
+        window = self._window
+        np = self._np
+        if np is not None:
+            head = signal[:window]
+            delta = self._delta
+            for tau in range(1, len(difference)):
+                # Work in place in delta. Slicing signal makes a view, not a copy.
+                delta[:] = head
+                delta -= signal[tau : tau + window]
+                delta *= delta
+                difference[tau] = np.sum(delta)
+            return
+        for tau in range(1, len(difference)):
+            total = 0
+            for j in range(window):
+                delta = signal[j] - signal[j + tau]
+                total += delta * delta
+            difference[tau] = total
+
+    def estimate(self, sample_rate: int, tau_min: int, threshold: float) -> Tuple[float, float]:
+        """Return the frequency and confidence of the pitch in ``samples``."""
+        self._decimate()
+        self._difference_function()
+        difference = self._difference
+        # Cumulative mean normalised difference, calculated in place.
+        difference[0] = 1
+        running_total = 0
+        for tau in range(1, len(difference)):
+            running_total += difference[tau]
+            difference[tau] = difference[tau] * tau / running_total if running_total else 1
+        # Take the first dip below the threshold, or failing that the deepest dip.
+        best = tau_min
+        for tau in range(tau_min, self.tau_max + 1):
+            if difference[tau] < threshold:
+                best = tau
+                while best < self.tau_max and difference[best + 1] < difference[best]:
+                    best += 1
+                break
+            if difference[tau] < difference[best]:
+                best = tau
+        # Refine the lag by fitting a parabola through the dip and its neighbours.
+        lag = best
+        if 0 < best < self.tau_max:
+            before, at, after = difference[best - 1], difference[best], difference[best + 1]
+            curve = before - 2 * at + after
+            if curve:
+                lag += (before - after) / (2 * curve)
+        confidence = max(0.0, min(1.0, 1 - difference[best]))
+        return sample_rate / self.factor / lag, confidence
+
+
+class _ClueSoundOnsetDetector:
+    """Detect sudden sounds against an adaptive estimate of the background noise."""
+
+    def __init__(
+        self, clue: "Clue", sensitivity: float, frame_size: int, floor_speed: float, release: float
+    ):
+        self._stream = clue.sound_stream(frame_size=frame_size, buffers=1)
+        self._sensitivity = sensitivity
+        self._floor_speed = floor_speed
+        self._release = release
+        self._dc = None
+        self._armed = True
+        self.noise_floor = None
+        """The running estimate of the background sound level."""
+        self.envelope = 0.0
+        """The sound level, following rises at once and falls at the ``release`` rate."""
+        self.onsets = 0
+        """The number of onsets detected."""
+        self.last_onset = None
+        """The ``time.monotonic()`` time of the last onset, or ``None``."""
+
+    def _level(self, frame: array.array) -> float:
+        # Mean absolute deviation, which is cheaper than RMS and needs no square root.
+        np = _numpy()
+        if np is not None:
+            values = np.frombuffer(frame, dtype=np.uint16)
+            return float(np.mean(abs(values - np.mean(values))))
+        # Measure every other sample against the DC offset of the previous frame, so only
+        # one pass is needed.
+        dc = frame[0] if self._dc is None else self._dc
+        deviation = 0
+        total = 0
+        for i in range(0, len(frame), 2):
+            sample = frame[i]
+            deviation += abs(sample - dc)
+            total += sample
+        count = (len(frame) + 1) // 2
+        self._dc = total / count
+        return deviation / count
+
+    def update(self) -> Optional[float]:
+        """Record and analyse the next block of sound. Returns the ``time.monotonic()`` time of
+        the onset if one started in this block, otherwise ``None``."""
+        level = self._level(self._stream.read())
+        self.envelope = max(level, self.envelope * self._release)
+        if self.noise_floor is None:
+            self.noise_floor = level
+            return None
+        threshold = self.noise_floor * self._sensitivity
+        speed = self._floor_speed
+        if self.envelope < threshold:
+            # Re-arm once the last onset has died away.
+            self._armed = True
+        else:
+            # Loud blocks move the noise floor ten times more slowly, so a short sound barely
+            # raises it but a lasting change in background noise is still followed.
+            speed /= 10
+        self.noise_floor += (level - self.noise_floor) * speed
+        if level > threshold and self._armed:
+            self._armed = False
+            self.onsets += 1
+            self.last_onset = time.monotonic()
+            return self.last_onset
+        return None
+
+
+def _record_to_file(clue: "Clue", path: str, seconds: float, frame_size: int, mic) -> int:
+    """Record the microphone to a WAV file for :meth:`Clue.record_to_file`."""
+    if mic is None:
+        mic = clue._get_mic()
+    rate = mic.sample_rate
+    remaining = int(seconds * rate)
+    stream = _ClueMicStream(clue, frame_size, rate, 2, mic)
+    header = "<4sI4s4sIHHIIHH4sI"
+    with open(path, "w+b") as file:
+        # The sizes are written as zero and filled in once the recording is finished.
+        file.write(
+            struct.pack(
+                header,
+                b"RIFF",
+                0,
+                b"WAVE",
+                b"fmt ",
+                16,
+                1,
+                1,
+                rate,
+                rate * 2,
+                2,
+                16,
+                b"data",
+                0,
+            )
+        )
+        written = 0
+        while written < remaining:
+            frame = stream.read()
+            count = min(frame_size, remaining - written)
+            file.write(memoryview(frame)[:count])
+            written += count
+        # The microphone's samples are unsigned, but 16-bit WAV samples are signed. They are
+        # converted in the file afterwards, to keep the work out of the gaps between frames.
+        converted = 0
+        while converted < written:
+            count = min(frame_size, written - converted)
+            file.seek(44 + converted * 2)
+            file.readinto(memoryview(frame)[:count])
+            for i in range(count):
+                frame[i] ^= 0x8000
+            file.seek(44 + converted * 2)
+            file.write(memoryview(frame)[:count])
+            converted += count
+        file.seek(4)
+        file.write(struct.pack("<I", 36 + written * 2))
+        file.seek(40)
+        file.write(struct.pack("<I", written * 2))
+    return stream.dropped_frames
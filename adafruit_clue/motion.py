@@ -0,0 +1,414 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_clue.motion`
+================================================================================
+
+The motion sampler, shake detector and accelerometer FIFO returned by
+:class:`adafruit_clue.Clue`, imported the first time one of them is made.
+"""
+
+try:
+    from typing import Optional, Tuple
+except ImportError:
+    pass
+
+import array
+import math
+import time
+
+import board
+
+from adafruit_clue import _LSM6DS_RATES, Clue
+from adafruit_clue.sensors import _LIS3MDL_OUT_X_L, _LSM6DS_OUTX_L_G, _int16
+
+# LSM6DS FIFO registers, the same on the LSM6DS33 and LSM6DS3TR-C.
+_LSM6DS_FIFO_CTRL1 = 0x06  # Threshold, followed by FIFO_CTRL2 to FIFO_CTRL5.
+_LSM6DS_FIFO_CTRL3 = 0x08  # Gyro and accelerometer decimation.
+_LSM6DS_FIFO_CTRL5 = 0x0A  # FIFO data rate and mode.
+_LSM6DS_FIFO_STATUS1 = 0x3A  # Unread words, followed by FIFO_STATUS2 to FIFO_STATUS4.
+_LSM6DS_FIFO_DATA_OUT_L = 0x3E
+_LSM6DS_FIFO_NO_DECIMATION = 0b001001  # Store every gyro and accelerometer sample.
+_LSM6DS_FIFO_CONTINUOUS = 0b110
+_LSM6DS_FIFO_OVERRUN = 0x40
+# The gyro only goes up to 1666 Hz.
+_LSM6DS_GYRO_RATES = _LSM6DS_RATES[:8]
+
+# LSM6DS embedded function registers used by Clue.enable_motion_events().
+_LSM6DS_INT1_CTRL = 0x0D
+_LSM6DS_CTRL10_C = 0x19
+_LSM6DS_WAKE_UP_SRC = 0x1B  # Followed by TAP_SRC.
+_LSM6DS_FUNC_SRC = 0x53
+_LSM6DS_TAP_CFG = 0x58  # Followed by TAP_THS_6D, INT_DUR2, WAKE_UP_THS, WAKE_UP_DUR,
+# FREE_FALL and MD1_CFG.
+_MOTION_EVENTS = ("tap", "double_tap", "tilt", "free_fall", "wake_up", "significant_motion")
+
+
+class _ClueMotionSampler:
+    """Sample the motion sensors at a fixed rate into ring buffers."""
+
+    def __init__(self, clue: "Clue", rate: float, size: int, magnetic: bool):
+        self._clue = clue
+        self._period_ns = int(1_000_000_000 / rate)
+        self._next_ns = None
+        self._index = 0
+        self.size = size
+        """The number of samples each ring buffer holds."""
+        self.count = 0
+        """The number of valid samples in the ring buffers, up to ``size``."""
+        self.samples_taken = 0
+        """The total number of samples taken."""
+        self.overruns = 0
+        """The number of sample times missed because `update` was not called often enough."""
+        self.acceleration = tuple(array.array("f", [0] * size) for _ in range(3))
+        """The x, y and z acceleration ring buffers."""
+        self.gyro = tuple(array.array("f", [0] * size) for _ in range(3))
+        """The x, y and z gyro ring buffers."""
+        self.magnetic = tuple(array.array("f", [0] * size) for _ in range(3)) if magnetic else None
+        """The x, y and z magnetic ring buffers, or ``None`` if magnetic sampling is off."""
+
+    def update(self) -> bool:
+        """Take a sample if one is due. Call this as often as possible, at least once per
+        sample period. Returns ``True`` if a sample was taken."""
+        now = time.monotonic_ns()
+        if self._next_ns is None:
+            self._next_ns = now
+        elif now < self._next_ns:
+            return False
+        # Keep to the fixed sample times, counting any that were missed.
+        missed = (now - self._next_ns) // self._period_ns
+        self.overruns += missed
+        self._next_ns += (missed + 1) * self._period_ns
+        self._sample()
+        return True
+
+    async def run(self):
+        """Take samples in an asyncio task, sleeping until each sample is due.
+
+        .. code-block:: python
+
+          import asyncio
+          from adafruit_clue import clue
+
+          sampler = clue.motion_sampler(rate=50)
+          asyncio.create_task(sampler.run())
+        """
+        import asyncio  # noqa: PLC0415
+
+        while True:
+            self.update()
+            await asyncio.sleep(max(0, self._next_ns - time.monotonic_ns()) / 1_000_000_000)
+
+    def _sample(self):
+        clue = self._clue
+        index = self._index
+        accelerometer = clue._get_accelerometer()
+        buffer = clue._read_registers(accelerometer, _LSM6DS_OUTX_L_G, 12)
+        for axis in range(3):
+            self.gyro[axis][index] = math.radians(
+                accelerometer._scale_gyro_data(_int16(buffer, axis * 2))
+            )
+            self.acceleration[axis][index] = accelerometer._scale_xl_data(
+                _int16(buffer, 6 + axis * 2)
+            )
+        if self.magnetic is not None:
+            magnetometer = clue._get_magnetometer()
+            buffer = clue._read_registers(magnetometer, _LIS3MDL_OUT_X_L, 6)
+            for axis in range(3):
+                self.magnetic[axis][index] = magnetometer._scale_mag_data(_int16(buffer, axis * 2))
+        self._index = (index + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+        self.samples_taken += 1
+
+    def _buffers(self, sensor: str):
+        if sensor == "acceleration":
+            return self.acceleration
+        if sensor == "gyro":
+            return self.gyro
+        if sensor == "magnetic" and self.magnetic is not None:
+            return self.magnetic
+        raise ValueError(f"Not sampling {sensor}")
+
+    def latest(self, sensor: str = "acceleration") -> Tuple[float, float, float]:
+        """The most recent x, y, z sample.
+
+        :param str sensor: ``"acceleration"``, ``"gyro"`` or ``"magnetic"``.
+        """
+        if not self.count:
+            raise RuntimeError("No samples taken yet")
+        index = self._index - 1
+        return tuple(axis[index] for axis in self._buffers(sensor))
+
+    def window(self, n: int, sensor: str = "acceleration") -> Tuple[array.array, ...]:
+        """The last ``n`` samples, oldest first, as x, y and z arrays.
+
+        :param int n: The number of samples. Must not be more than `count`.
+        :param str sensor: ``"acceleration"``, ``"gyro"`` or ``"magnetic"``.
+        """
+        if n > self.count:
+            raise ValueError("Not enough samples")
+        start = (self._index - n) % self.size
+        windows = []
+        for axis in self._buffers(sensor):
+            if start + n <= self.size:
+                windows.append(axis[start : start + n])
+            else:
+                windows.append(axis[start:] + axis[: start + n - self.size])
+        return tuple(windows)
+
+
+class _ClueShakeDetector:
+    """Detect shakes from a running average of acceleration samples."""
+
+    def __init__(self, clue: "Clue", shake_threshold: float, avg_count: int, latch: bool):
+        self._clue = clue
+        self._avg_count = avg_count
+        # Compare the squared magnitude of the summed window against the squared
+        # threshold scaled by the window length, so no division or sqrt is needed.
+        self._threshold_squared = (shake_threshold * avg_count) ** 2
+        self._latch = latch
+        self._samples = array.array("f", [0] * (3 * avg_count))
+        self._sums = [0.0, 0.0, 0.0]
+        self._index = 0
+        self._latched = False
+        self.shaking = False
+        """``True`` if the average acceleration of the last window exceeded the threshold."""
+
+    def update(self, acceleration: Optional[Tuple[float, float, float]] = None) -> bool:
+        """Add an acceleration sample to the window and return whether the board is shaking.
+
+        :param acceleration: The x, y, z sample to add, for example from a motion sampler.
+                             Reads ``clue.acceleration`` if not provided.
+        """
+        if acceleration is None:
+            acceleration = self._clue.acceleration
+        samples = self._samples
+        sums = self._sums
+        offset = self._index * 3
+        for axis in range(3):
+            sums[axis] += acceleration[axis] - samples[offset + axis]
+            samples[offset + axis] = acceleration[axis]
+        self._index += 1
+        if self._index == self._avg_count:
+            self._index = 0
+            # Recalculate the sums once per window so float rounding cannot build up.
+            sums[0] = sums[1] = sums[2] = 0.0
+            for i in range(0, len(samples), 3):
+                sums[0] += samples[i]
+                sums[1] += samples[i + 1]
+                sums[2] += samples[i + 2]
+        self.shaking = (
+            sums[0] * sums[0] + sums[1] * sums[1] + sums[2] * sums[2] > self._threshold_squared
+        )
+        if self.shaking:
+            self._latched = True
+        return self.shaking
+
+    @property
+    def shaken(self) -> bool:
+        """``True`` if a shake was detected. In latch mode this stays ``True`` until it is read,
+        so a short shake between checks is not missed."""
+        if not self._latch:
+            return self.shaking
+        shaken = self._latched
+        self._latched = self.shaking
+        return shaken
+
+
+class _ClueMotionFIFO:
+    """Capture accelerometer and gyro data through the LSM6DS hardware FIFO."""
+
+    def __init__(self, clue: "Clue", rate: float):
+        if rate not in _LSM6DS_GYRO_RATES:
+            raise ValueError(f"rate must be one of {_LSM6DS_GYRO_RATES}")
+        self._clue = clue
+        self._accelerometer = clue._get_accelerometer()
+        self.overruns = 0
+        """The number of times the FIFO filled up and samples were lost before being read."""
+        # The data rates in use before, restored by stop().
+        self._rates = (
+            self._accelerometer.accelerometer_data_rate,
+            self._accelerometer.gyro_data_rate,
+        )
+        rate_value = _LSM6DS_RATES.index(rate) + 1
+        self._accelerometer.accelerometer_data_rate = rate_value
+        self._accelerometer.gyro_data_rate = rate_value
+        # Start in bypass mode to empty the FIFO, then keep both sensors at the full rate and
+        # switch to continuous mode, where the oldest samples are overwritten when it is full.
+        clue._write_register(self._accelerometer, _LSM6DS_FIFO_CTRL5, 0)
+        clue._write_register(self._accelerometer, _LSM6DS_FIFO_CTRL1, 0)
+        clue._write_register(self._accelerometer, _LSM6DS_FIFO_CTRL3, _LSM6DS_FIFO_NO_DECIMATION)
+        clue._write_register(
+            self._accelerometer, _LSM6DS_FIFO_CTRL5, rate_value << 3 | _LSM6DS_FIFO_CONTINUOUS
+        )
+
+    def _status(self) -> Tuple[int, int]:
+        # Returns the number of unread 16-bit words and the pattern of the next word.
+        buffer = self._clue._read_registers(self._accelerometer, _LSM6DS_FIFO_STATUS1, 4)
+        if buffer[1] & _LSM6DS_FIFO_OVERRUN:
+            self.overruns += 1
+        return buffer[0] | (buffer[1] & 0x0F) << 8, buffer[2] | (buffer[3] & 0x03) << 8
+
+    @property
+    def available(self) -> int:
+        """The number of complete samples waiting in the FIFO."""
+        return self._status()[0] // 6
+
+    def read_into(
+        self,
+        buffer: bytearray,
+        acceleration: Optional[Tuple[array.array, array.array, array.array]] = None,
+        gyro: Optional[Tuple[array.array, array.array, array.array]] = None,
+    ) -> int:
+        """Drain the FIFO into ``buffer`` in one bulk read, then decode the samples into the x, y
+        and z arrays of ``acceleration`` and ``gyro``. Returns the number of samples read, which
+        is at most ``len(buffer) // 12`` and at most the length of the arrays.
+
+        :param bytearray buffer: Receives the raw FIFO data, 12 bytes per sample.
+        :param acceleration: Three ``array("f")`` to receive x, y, z acceleration in m/s^2.
+        :param gyro: Three ``array("f")`` to receive x, y, z angular velocity in radians/s.
+        """
+        clue = self._clue
+        accelerometer = self._accelerometer
+        words, pattern = self._status()
+        if pattern:
+            # Skip the rest of a partly read sample so each sample starts with gyro x.
+            skip = 6 - pattern
+            with accelerometer.i2c_device as i2c:
+                clue._register_buffer[0] = _LSM6DS_FIFO_DATA_OUT_L
+                i2c.write_then_readinto(
+                    clue._register_buffer, buffer, out_end=1, in_end=min(skip * 2, len(buffer))
+                )
+            words -= skip
+        count = min(words // 6, len(buffer) // 12)
+        for axes in (acceleration, gyro):
+            if axes is not None:
+                count = min(count, len(axes[0]))
+        if count <= 0:
+            return 0
+        # The FIFO output register address wraps around, so the whole block is one read.
+        with accelerometer.i2c_device as i2c:
+            clue._register_buffer[0] = _LSM6DS_FIFO_DATA_OUT_L
+            i2c.write_then_readinto(clue._register_buffer, buffer, out_end=1, in_end=count * 12)
+        for sample in range(count):
+            offset = sample * 12
+            for axis in range(3):
+                if gyro is not None:
+                    gyro[axis][sample] = math.radians(
+                        accelerometer._scale_gyro_data(_int16(buffer, offset + axis * 2))
+                    )
+                if acceleration is not None:
+                    acceleration[axis][sample] = accelerometer._scale_xl_data(
+                        _int16(buffer, offset + 6 + axis * 2)
+                    )
+        return count
+
+    def stop(self):
+        """Stop collecting samples, return the FIFO to bypass mode and put the accelerometer
+        and gyro data rates back to what they were before."""
+        self._clue._write_register(self._accelerometer, _LSM6DS_FIFO_CTRL5, 0)
+        (
+            self._accelerometer.accelerometer_data_rate,
+            self._accelerometer.gyro_data_rate,
+        ) = self._rates
+
+
+def _enable_motion_events(
+    clue: "Clue",
+    tap: bool,
+    double_tap: bool,
+    tilt: bool,
+    free_fall: bool,
+    wake_up: bool,
+    significant_motion: bool,
+    tap_threshold: int,
+    wake_up_threshold: int,
+) -> Tuple[str, ...]:
+    """Set up the accelerometer for :meth:`Clue.enable_motion_events` and return the names of
+    the events turned on."""
+    import adafruit_lsm6ds.lsm6ds3trc  # noqa: PLC0415
+
+    accelerometer = clue._get_accelerometer()
+    # The LSM6DS3TR-C needs a global interrupt enable bit, and keeps its tilt and
+    # pedometer enable bits in CTRL10_C, where the LSM6DS33 has its gyro axis enables.
+    trc = isinstance(accelerometer, adafruit_lsm6ds.lsm6ds3trc.LSM6DS3TRC)
+    if (tap or double_tap) and not 6 <= accelerometer.accelerometer_data_rate <= 10:
+        accelerometer.accelerometer_data_rate = _LSM6DS_RATES.index(416) + 1
+
+    tap_cfg = 0x01  # Latch interrupts until the source registers are read.
+    if tap or double_tap:
+        tap_cfg |= 0x0E  # Tap detection on x, y and z.
+    if trc and (tap or double_tap or free_fall or wake_up):
+        tap_cfg |= 0x80
+    ctrl10_c = clue._read_registers(accelerometer, _LSM6DS_CTRL10_C, 1)[0]
+    ctrl10_c &= ~(0x1D if trc else 0x05)
+    if tilt or significant_motion:
+        ctrl10_c |= 0x04  # Embedded functions enable.
+    if tilt:
+        if trc:
+            ctrl10_c |= 0x08
+        else:
+            tap_cfg |= 0x20
+    if significant_motion:
+        # Significant motion is detected by the pedometer.
+        ctrl10_c |= 0x01
+        if trc:
+            ctrl10_c |= 0x10
+        else:
+            tap_cfg |= 0x40
+    # Route the enabled events to the interrupt pin, see motion_events.
+    md1_cfg = (
+        (0x40 if tap else 0)
+        | (0x20 if wake_up else 0)
+        | (0x10 if free_fall else 0)
+        | (0x08 if double_tap else 0)
+        | (0x02 if tilt else 0)
+    )
+    int1_ctrl = clue._read_registers(accelerometer, _LSM6DS_INT1_CTRL, 1)[0] & ~0x40
+    if significant_motion:
+        int1_ctrl |= 0x40
+
+    buffer = bytearray(8)
+    buffer[0] = _LSM6DS_TAP_CFG
+    buffer[1] = tap_cfg
+    buffer[2] = tap_threshold & 0x1F  # TAP_THS_6D
+    buffer[3] = 0x7F if double_tap else 0x06  # INT_DUR2: tap duration, quiet and shock.
+    buffer[4] = (0x80 if double_tap else 0) | (wake_up_threshold & 0x3F)  # WAKE_UP_THS
+    buffer[5] = 0x00  # WAKE_UP_DUR
+    buffer[6] = 0x33  # FREE_FALL: 312 mg for 6 samples.
+    buffer[7] = md1_cfg
+    with accelerometer.i2c_device as i2c:
+        i2c.write(buffer)
+    clue._write_register(accelerometer, _LSM6DS_CTRL10_C, ctrl10_c)
+    clue._write_register(accelerometer, _LSM6DS_INT1_CTRL, int1_ctrl)
+
+    enabled = (tap, double_tap, tilt, free_fall, wake_up, significant_motion)
+    return tuple(event for event, enable in zip(_MOTION_EVENTS, enabled) if enable)
+
+
+def _read_motion_events(clue: "Clue", enabled: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Read which of the ``enabled`` events the accelerometer has detected, for
+    :attr:`Clue.motion_events`."""
+    accelerometer = clue._get_accelerometer()
+    detected = []
+    if clue._digital_io(board.ACCELEROMETER_GYRO_INTERRUPT, pull=None).value:
+        buffer = clue._read_registers(accelerometer, _LSM6DS_WAKE_UP_SRC, 2)
+        wake_up_src, tap_src = buffer[0], buffer[1]
+        if tap_src & 0x20:
+            detected.append("tap")
+        if tap_src & 0x10:
+            detected.append("double_tap")
+        if wake_up_src & 0x20:
+            detected.append("free_fall")
+        if wake_up_src & 0x08:
+            detected.append("wake_up")
+    if "tilt" in enabled or "significant_motion" in enabled:
+        # Tilt and significant motion only pulse the interrupt pin, so always check them.
+        func_src = clue._read_registers(accelerometer, _LSM6DS_FUNC_SRC, 1)[0]
+        if func_src & 0x20:
+            detected.append("tilt")
+        if func_src & 0x40:
+            detected.append("significant_motion")
+    return tuple(event for event in detected if event in enabled)
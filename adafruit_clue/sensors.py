@@ -0,0 +1,175 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_clue.sensors`
+================================================================================
+
+Reading several sensors at once, and reading sensors into existing buffers, for
+:class:`adafruit_clue.Clue`. Imported the first time one of these is used.
+"""
+
+try:
+    from typing import Optional, Tuple
+except ImportError:
+    pass
+
+import math
+
+from adafruit_clue import _SENSOR_NAMES, Clue, SensorReadings
+
+# Output registers read directly by Clue.read_all(), the *_into() methods and the motion
+# sampler.
+_LSM6DS_OUTX_L_G = 0x22  # Gyro X, Y, Z followed by accelerometer X, Y, Z.
+_LSM6DS_OUTX_L_A = 0x28
+_LIS3MDL_OUT_X_L = 0x28
+_APDS9960_CDATAL = 0x94  # Clear, red, green and blue channels.
+
+# Sensors that Clue.read_all() reads together, for Clue.async_read_all() to yield between.
+_SENSOR_GROUPS = (
+    ("acceleration", "gyro"),
+    ("magnetic",),
+    ("proximity", "color"),
+    ("humidity",),
+    ("pressure", "temperature", "altitude"),
+)
+
+
+def _sensor_names(sensors: Optional[Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Check the sensor names passed to :meth:`Clue.read_all`, defaulting to all of them."""
+    if sensors is None:
+        return _SENSOR_NAMES
+    for name in sensors:
+        if name not in _SENSOR_NAMES:
+            raise ValueError(f"Unknown sensor: {name}")
+    return sensors
+
+
+def _int16(buffer: bytearray, index: int) -> int:
+    """Decode the signed little-endian 16-bit value at ``index`` in ``buffer``."""
+    value = buffer[index] | (buffer[index + 1] << 8)
+    return value - 0x10000 if value & 0x8000 else value
+
+
+def _acceleration_into(clue: "Clue", buffer):
+    """Read the accelerometer into ``buffer`` for :meth:`Clue.acceleration_into`."""
+    accelerometer = clue._get_accelerometer()
+    data = clue._read_registers(accelerometer, _LSM6DS_OUTX_L_A, 6)
+    for axis in range(3):
+        buffer[axis] = accelerometer._scale_xl_data(_int16(data, axis * 2))
+
+
+def _gyro_into(clue: "Clue", buffer):
+    """Read the gyro into ``buffer`` for :meth:`Clue.gyro_into`."""
+    accelerometer = clue._get_accelerometer()
+    data = clue._read_registers(accelerometer, _LSM6DS_OUTX_L_G, 6)
+    for axis in range(3):
+        buffer[axis] = math.radians(accelerometer._scale_gyro_data(_int16(data, axis * 2)))
+
+
+def _magnetic_into(clue: "Clue", buffer):
+    """Read the magnetometer into ``buffer`` for :meth:`Clue.magnetic_into`."""
+    magnetometer = clue._get_magnetometer()
+    data = clue._read_registers(magnetometer, _LIS3MDL_OUT_X_L, 6)
+    for axis in range(3):
+        buffer[axis] = magnetometer._scale_mag_data(_int16(data, axis * 2))
+
+
+def _color_into(clue: "Clue", buffer):
+    """Read the color channels into ``buffer`` for :meth:`Clue.color_into`."""
+    sensor = clue._get_sensor()
+    sensor.enable_color = True
+    data = clue._read_registers(sensor, _APDS9960_CDATAL, 8)
+    # The sensor stores clear first, then red, green and blue.
+    buffer[3] = data[0] | (data[1] << 8)
+    for channel in range(3):
+        offset = 2 + channel * 2
+        buffer[channel] = data[offset] | (data[offset + 1] << 8)
+
+
+def _read_all(clue: "Clue", sensors: Optional[Tuple[str, ...]]) -> SensorReadings:
+    """Read the sensors for :meth:`Clue.read_all`."""
+    sensors = _sensor_names(sensors)
+    readings = {}
+
+    if "acceleration" in sensors or "gyro" in sensors:
+        accelerometer = clue._get_accelerometer()
+        # The gyro and accelerometer output registers are consecutive, so all six axes
+        # are read in one 12 byte burst and scaled the same way as the driver does.
+        buffer = clue._read_registers(accelerometer, _LSM6DS_OUTX_L_G, 12)
+        readings["gyro"] = tuple(
+            math.radians(accelerometer._scale_gyro_data(_int16(buffer, i))) for i in (0, 2, 4)
+        )
+        readings["acceleration"] = tuple(
+            accelerometer._scale_xl_data(_int16(buffer, i)) for i in (6, 8, 10)
+        )
+
+    if "magnetic" in sensors:
+        magnetometer = clue._get_magnetometer()
+        buffer = clue._read_registers(magnetometer, _LIS3MDL_OUT_X_L, 6)
+        readings["magnetic"] = tuple(
+            magnetometer._scale_mag_data(_int16(buffer, i)) for i in (0, 2, 4)
+        )
+
+    if "proximity" in sensors:
+        readings["proximity"] = clue.proximity
+
+    if "color" in sensors:
+        sensor = clue._get_sensor()
+        sensor.enable_color = True
+        buffer = clue._read_registers(sensor, _APDS9960_CDATAL, 8)
+        clear, red, green, blue = (buffer[i] | (buffer[i + 1] << 8) for i in (0, 2, 4, 6))
+        readings["color"] = (red, green, blue, clear)
+
+    if "humidity" in sensors:
+        humidity = clue._cached("humidity")
+        if humidity is None:
+            humidity = clue._cache_reading("humidity", clue._get_humidity().relative_humidity)
+        readings["humidity"] = humidity
+
+    # Use cached environmental readings where cache_policy() allows, and only read the
+    # pressure sensor for the rest.
+    missing = []
+    for name in ("pressure", "temperature", "altitude"):
+        if name in sensors:
+            readings[name] = clue._cached(name)
+            if readings[name] is None:
+                missing.append(name)
+    if "pressure" in missing or "altitude" in missing:
+        pressure_sensor = clue._get_pressure()
+        # Reading the pressure also reads the temperature, which the driver keeps in
+        # _t_fine, so the temperature and altitude come for free.
+        pressure = pressure_sensor.pressure
+        readings["pressure"] = clue._cache_reading("pressure", pressure)
+        readings["temperature"] = clue._cache_reading(
+            "temperature", pressure_sensor._t_fine / 5120.0
+        )
+        readings["altitude"] = clue._cache_reading(
+            "altitude",
+            44330 * (1.0 - math.pow(pressure / pressure_sensor.sea_level_pressure, 0.1903)),
+        )
+    elif missing:
+        readings["temperature"] = clue._cache_reading(
+            "temperature", clue._get_pressure().temperature
+        )
+
+    return SensorReadings(
+        *[readings.get(name) if name in sensors else None for name in _SENSOR_NAMES]
+    )
+
+
+async def _async_read_all(clue: "Clue", sensors: Optional[Tuple[str, ...]]) -> SensorReadings:
+    """Read the sensors for :meth:`Clue.async_read_all`."""
+    import asyncio  # noqa: PLC0415
+
+    sensors = _sensor_names(sensors)
+    readings = {}
+    for group in _SENSOR_GROUPS:
+        names = tuple(name for name in group if name in sensors)
+        if names:
+            group_readings = _read_all(clue, names)
+            for name in names:
+                readings[name] = getattr(group_readings, name)
+            await asyncio.sleep(0)
+    return SensorReadings(*[readings.get(name) for name in _SENSOR_NAMES])
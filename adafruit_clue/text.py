@@ -0,0 +1,367 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_clue.text`
+================================================================================
+
+The :meth:`adafruit_clue.Clue.simple_text_display` text lines, imported the first time a
+text display is made.
+"""
+
+try:
+    from typing import Optional, Tuple, Union
+except ImportError:
+    pass
+
+import array
+
+import board
+import displayio
+
+from adafruit_clue import Clue
+
+
+class _ClueTextLine:
+    """A line of :class:`_ClueSimpleTextDisplay`. Setting ``text`` or ``color`` to the value it
+    already has does nothing, so the label is only laid out and drawn again when it changes.
+    Any other attribute is read from and written to the underlying ``label``."""
+
+    def __init__(self, display: "_ClueSimpleTextDisplay", text_label):
+        self._display = display
+        self.label = text_label
+        """The ``adafruit_display_text`` label drawing the line."""
+        self._text = text_label.text
+        self._color = text_label.color
+        self._dirty = False
+
+    def __getattr__(self, name: str):
+        return getattr(self.label, name)
+
+    def __setattr__(self, name: str, value):
+        # CPython calls this for every attribute, including text and color, while CircuitPython
+        # uses the property setters first, so both end up in _set_text() and _set_color().
+        if name == "text":
+            self._set_text(value)
+        elif name == "color":
+            self._set_color(value)
+        elif name == "label" or name.startswith("_"):
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.label, name, value)
+
+    def _set_text(self, text: str):
+        if text != self._text:
+            self._text = text
+            self.label.text = text
+            self._display._line_changed(self)
+
+    def _set_color(self, color: Union[int, Tuple[int, int, int]]):
+        if color != self._color:
+            self._color = color
+            self.label.color = color
+            self._display._line_changed(self)
+
+    @property
+    def text(self) -> str:
+        """The text of the line."""
+        return self._text
+
+    @text.setter
+    def text(self, text: str):
+        self._set_text(text)
+
+    @property
+    def color(self) -> Union[int, Tuple[int, int, int]]:
+        """The color of the line's text."""
+        return self._color
+
+    @color.setter
+    def color(self, color: Union[int, Tuple[int, int, int]]):
+        self._set_color(color)
+
+
+class _ClueTileTextLine:
+    """A line of :class:`_ClueSimpleTextDisplay` drawn as a row of tiles taken straight from
+    the font's glyph bitmap. Changing the text only rewrites the tiles of characters that
+    changed, with no layout. Text longer than the line is cut off."""
+
+    def __init__(self, display: "_ClueSimpleTextDisplay", columns: int, color, y: int):
+        font = display._font
+        self._display = display
+        self._glyph_height = font.get_bounding_box()[1]
+        self._space = display._tile_index(" ")
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
+        self._palette[1] = color
+        self.tile_grid = displayio.TileGrid(
+            font.bitmap,
+            pixel_shader=self._palette,
+            width=columns,
+            height=1,
+            tile_width=font.get_bounding_box()[0],
+            tile_height=self._glyph_height,
+            default_tile=self._space,
+        )
+        """The ``displayio.TileGrid`` drawing the line."""
+        self._tiles = array.array("H", [self._space] * columns)
+        self._text = ""
+        self._color = color
+        self._dirty = False
+        self.y = y
+
+    @property
+    def text(self) -> str:
+        """The text of the line."""
+        return self._text
+
+    @text.setter
+    def text(self, text: str):
+        if text == self._text:
+            return
+        self._text = text
+        text = str(text)
+        tiles = self._tiles
+        tile_grid = self.tile_grid
+        changed = False
+        for column in range(len(tiles)):
+            tile = self._display._tile_index(text[column]) if column < len(text) else self._space
+            if tiles[column] != tile:
+                tiles[column] = tile
+                tile_grid[column] = tile
+                changed = True
+        if changed:
+            self._display._line_changed(self)
+
+    @property
+    def color(self) -> Union[int, Tuple[int, int, int]]:
+        """The color of the line's text."""
+        return self._color
+
+    @color.setter
+    def color(self, color: Union[int, Tuple[int, int, int]]):
+        if color != self._color:
+            self._color = color
+            self._palette[1] = color
+            self._display._line_changed(self)
+
+    @property
+    def x(self) -> int:
+        """The position of the line's left edge."""
+        return self.tile_grid.x
+
+    @x.setter
+    def x(self, x: int):
+        self.tile_grid.x = x
+
+    @property
+    def y(self) -> int:
+        """The position of the middle of the line, as for a label."""
+        return self.tile_grid.y + self._glyph_height // 2
+
+    @y.setter
+    def y(self, y: int):
+        self.tile_grid.y = y - self._glyph_height // 2
+
+
+class _ClueSimpleTextDisplay:
+    """Easily display lines of text on CLUE display."""
+
+    def __init__(
+        self,
+        title: Optional[str] = None,
+        title_color: Union[int, Tuple[int, int, int]] = 0xFFFFFF,
+        title_scale: int = 1,
+        text_scale: int = 1,
+        font: Optional[str] = None,
+        colors: Optional[Tuple[Tuple[int, int, int], ...]] = None,
+        fast_text: bool = False,
+        scrolling: bool = False,
+        history: int = 100,
+    ):
+        import terminalio  # noqa: PLC0415
+        from adafruit_display_text import label  # noqa: PLC0415
+
+        if not colors:
+            colors = (
+                Clue.VIOLET,
+                Clue.GREEN,
+                Clue.RED,
+                Clue.CYAN,
+                Clue.ORANGE,
+                Clue.BLUE,
+                Clue.MAGENTA,
+                Clue.SKY,
+                Clue.YELLOW,
+                Clue.PURPLE,
+            )
+
+        self._colors = colors
+        self._label = label
+        self._display = board.DISPLAY
+        self._font = terminalio.FONT
+        if font:
+            self._font = font
+
+        self.text_group = displayio.Group(scale=text_scale)
+
+        self._columns = None
+        if fast_text:
+            if not hasattr(self._font, "bitmap"):
+                raise ValueError("fast_text needs a built-in font such as terminalio.FONT")
+            self._columns = self._display.width // (self._font.get_bounding_box()[0] * text_scale)
+            # Tile index of each character drawn so far.
+            self._tile_indexes = {}
+
+        if title:
+            # Fail gracefully if title is longer than 60 characters.
+            if len(title) > 60:
+                raise ValueError("Title must be 60 characters or less.")
+
+            title = label.Label(
+                self._font,
+                text=title,
+                color=title_color,
+                scale=title_scale,
+            )
+            title.x = 0
+            title.y = 8
+            self._y = title.y + 18
+
+            self.text_group.append(title)
+        else:
+            self._y = 3
+
+        # The lines changed since the last show(), each marked with its _dirty flag.
+        self._dirty_lines = []
+        self.redrawn = 0
+        """The number of lines redrawn because their text or color changed before the last
+        ``show()``. Each line is counted once, however many times it changed. Setting a line to
+        the text or color it already has is not counted, because it is skipped."""
+
+        self._lines = []
+        # In scrolling mode, a fixed pool of lines fills the display and is reused as it
+        # scrolls. self._top is the index in self._lines of the line at the top, and the text
+        # of the last `history` logged lines is kept in a ring for scrolling back.
+        self._scrolling = scrolling
+        self._top = 0
+        self._history = [None] * history
+        self._logged = 0
+        self._scroll_offset = 0
+        rows = 1
+        if scrolling:
+            rows = max(1, (self._display.height // text_scale - 6 - self._y) // 13 + 1)
+        for num in range(rows):
+            self._lines.append(self.add_text_line(color=colors[num % len(colors)]))
+
+    def __getitem__(self, item: int):
+        """Fetch the Nth text line Group"""
+        if self._scrolling:
+            if not 0 <= item < len(self._lines):
+                raise IndexError("line index out of range")
+            return self._lines[(self._top + item) % len(self._lines)]
+        if len(self._lines) - 1 < item:
+            for _ in range(item - (len(self._lines) - 1)):
+                self._lines.append(self.add_text_line(color=self._colors[item % len(self._colors)]))
+        return self._lines[item]
+
+    def _tile_index(self, character: str) -> int:
+        index = self._tile_indexes.get(character)
+        if index is None:
+            glyph = self._font.get_glyph(ord(character))
+            if glyph is None:
+                glyph = self._font.get_glyph(ord("?"))
+            index = self._tile_indexes[character] = glyph.tile_index
+        return index
+
+    def _line_changed(self, line):
+        if not line._dirty:
+            line._dirty = True
+            self._dirty_lines.append(line)
+
+    def add_text_line(self, color: Union[int, Tuple[int, int, int]] = 0xFFFFFF):
+        """Adds a line on the display of the specified color and returns the line object."""
+        if self._columns:
+            line = _ClueTileTextLine(self, self._columns, color, self._y)
+            self._y += 13
+            self.text_group.append(line.tile_grid)
+            return line
+
+        text_label = self._label.Label(self._font, text="", color=color)
+        text_label.x = 0
+        text_label.y = self._y
+        self._y = text_label.y + 13
+        self.text_group.append(text_label)
+
+        return _ClueTextLine(self, text_label)
+
+    def log(self, text: str):
+        """Add a line of text below the last one. Once the display is full, every line moves up
+        and the top line is reused at the bottom. Only works in scrolling mode."""
+        if not self._scrolling:
+            raise RuntimeError("log() needs simple_text_display(scrolling=True)")
+        entry = self._logged
+        self._logged += 1
+        if self._history:
+            self._history[entry % len(self._history)] = text
+        if self._scroll_offset:
+            # Keep showing the same lines while scrolled back.
+            self._scroll_offset = min(self._scroll_offset + 1, self._max_scroll_offset())
+            self._show_history()
+            return
+        lines = self._lines
+        if entry < len(lines):
+            line = lines[entry]
+        else:
+            line = lines[self._top]
+            bottom = line.y + 13 * (len(lines) - 1)
+            self._top = (self._top + 1) % len(lines)
+            for other in lines:
+                other.y -= 13
+            line.y = bottom
+        line.text = text
+        line.color = self._colors[entry % len(self._colors)]
+
+    def _max_scroll_offset(self) -> int:
+        return max(0, min(self._logged, len(self._history)) - len(self._lines))
+
+    def _show_history(self):
+        lines = self._lines
+        first = max(0, self._logged - len(lines)) - self._scroll_offset
+        for row in range(len(lines)):
+            entry = first + row
+            line = lines[(self._top + row) % len(lines)]
+            if entry >= self._logged or entry < self._logged - len(self._history):
+                line.text = ""
+            else:
+                line.text = self._history[entry % len(self._history)]
+                line.color = self._colors[entry % len(self._colors)]
+
+    @property
+    def scroll_offset(self) -> int:
+        """How many lines back from the newest the display is scrolled in scrolling mode. Set
+        to 0 to show the newest lines again. Limited by the ``history`` kept."""
+        return self._scroll_offset
+
+    @scroll_offset.setter
+    def scroll_offset(self, offset: int):
+        offset = max(0, min(offset, self._max_scroll_offset()))
+        if offset != self._scroll_offset:
+            self._scroll_offset = offset
+            self._show_history()
+
+    def show(self):
+        """Call show() to display the data list. Does nothing to the display if the list is
+        already being shown."""
+        dirty_lines = self._dirty_lines
+        self.redrawn = len(dirty_lines)
+        for line in dirty_lines:
+            line._dirty = False
+        dirty_lines.clear()
+        if self._display.root_group is not self.text_group:
+            self._display.root_group = self.text_group
+
+    def show_terminal(self):
+        """Revert to terminalio screen."""
+        self._display.root_group = displayio.CIRCUITPYTHON_TERMINAL
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Check that ``acceleration_into()``, ``gyro_into()``, ``magnetic_into()`` and ``color_into()``
+allocate no memory, compared with the ``acceleration``, ``gyro``, ``magnetic`` and ``color``
+properties that return a new tuple on every read.
+
+Copy this file to a CLUE as ``code.py`` with the library installed and read the results from the
+serial console. Garbage collection is turned off while each loop runs, so any allocation shows up
+as a drop in ``gc.mem_free()``. Every ``*_into`` line should report 0 bytes.
+"""
+
+import array
+import gc
+
+from adafruit_clue import clue
+
+READS = 500
+
+vector = array.array("f", [0, 0, 0])
+color = array.array("H", [0, 0, 0, 0])
+
+
+def measure(label, read):
+    # Read once first, so creating the sensor driver is not counted.
+    read()
+    gc.collect()
+    gc.disable()
+    free = gc.mem_free()
+    for _ in range(READS):
+        read()
+    allocated = free - gc.mem_free()
+    gc.enable()
+    print(f"{label:<28} {allocated:8d} bytes {allocated / READS:8.1f} bytes per read")
+
+
+measure("acceleration", lambda: clue.acceleration)
+measure("acceleration_into", lambda: clue.acceleration_into(vector))
+measure("gyro", lambda: clue.gyro)
+measure("gyro_into", lambda: clue.gyro_into(vector))
+measure("magnetic", lambda: clue.magnetic)
+measure("magnetic_into", lambda: clue.magnetic_into(vector))
+measure("color", lambda: clue.color)
+measure("color_into", lambda: clue.color_into(color))
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Measure import-to-first-read time and heap use of ``adafruit_clue`` on a CLUE.
+
+Copy this file to a CLUE as ``code.py`` with the library installed, reset the board, and read
+the results from the serial console. To compare with an older version of the library, install
+that version and run the same file again. Each step is measured from before the import, so the
+numbers include everything that happened before the first read of that kind.
+"""
+
+import gc
+import time
+
+gc.collect()
+free_at_start = gc.mem_free()
+start = time.monotonic_ns()
+# Time spent measuring, which is left out of the times reported.
+paused = 0
+
+
+def report(label):
+    global paused  # noqa: PLW0603
+    now = time.monotonic_ns()
+    elapsed = (now - start - paused) / 1e6
+    gc.collect()
+    used = free_at_start - gc.mem_free()
+    print(f"{label:<32} {elapsed:9.1f} ms {used:8d} bytes")
+    paused += time.monotonic_ns() - now
+
+
+from adafruit_clue import clue
+
+report("import adafruit_clue")
+_ = clue.button_a
+report("first button read")
+_ = clue.acceleration
+report("first acceleration read")
+_ = clue.proximity
+report("first proximity read")
+_ = clue.temperature
+report("first temperature read")
+_ = clue.sound_level
+report("first sound_level read")
@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Measure note-on latency: how long ``start_tone()`` takes to get a tone playing.
+
+Copy this file to a CLUE as ``code.py`` with the library installed and read the results from the
+serial console. To compare with an older version of the library, install that version and run
+the same file again.
+"""
+
+import gc
+import time
+
+from adafruit_clue import clue
+
+REPEATS = 20
+
+
+def measure(label, setup, action):
+    times = []
+    for _ in range(REPEATS):
+        setup()
+        gc.collect()
+        start = time.monotonic_ns()
+        action()
+        times.append(time.monotonic_ns() - start)
+    times.sort()
+    median = times[len(times) // 2] / 1e6
+    print(f"{label:<40} median {median:7.3f} ms  max {times[-1] / 1e6:7.3f} ms")
+
+
+def release():
+    clue.stop_tone(release=True)
+
+
+def stop():
+    clue.stop_tone()
+
+
+def play_440():
+    clue.start_tone(440)
+
+
+def nothing():
+    pass
+
+
+# The first tone creates the speaker output and the sine table.
+clue.stop_tone(release=True)
+gc.collect()
+start = time.monotonic_ns()
+clue.start_tone(440)
+print(f"{'first tone after import':<40} {(time.monotonic_ns() - start) / 1e6:7.3f} ms")
+
+measure("note-on after stop_tone(release=True)", release, play_440)
+measure("note-on after stop_tone()", stop, play_440)
+measure("change frequency while playing", play_440, lambda: clue.start_tone(880))
+measure("same tone again while playing", play_440, play_440)
+measure("note-on with the square waveform", stop, lambda: clue.start_tone(440, "square"))
+clue.stop_tone(release=True)
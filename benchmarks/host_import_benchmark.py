@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Measure the time and memory ``import adafruit_clue`` takes on Linux, and which driver modules
+it loads, using the stand-in modules in ``host_stubs``. Also measures reading a button, the first
+thing many apps do.
+
+Only the time and memory of ``adafruit_clue`` itself are measured. The stand-in driver modules
+cost nothing to import, so the saving from not importing the real sensor, audio and NeoPixel
+drivers at startup does not show up here, and a version that imports them all can look cheaper.
+Use the list of driver modules loaded to compare that part, and ``clue_startup_benchmark.py``
+on a CLUE for the real import time and heap use.
+
+Run from the repository root::
+
+    python benchmarks/host_import_benchmark.py
+
+To compare with another version, pass the directory holding its ``adafruit_clue`` module or
+package::
+
+    mkdir /tmp/before
+    git archive <commit> | tar -x -C /tmp/before
+    python benchmarks/host_import_benchmark.py /tmp/before
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+library = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), "..")
+sys.path[:0] = [os.path.dirname(__file__), library]
+
+import host_stubs
+
+host_stubs.install()
+
+tracemalloc.start()
+start = time.perf_counter()
+import adafruit_clue
+
+imported = time.perf_counter()
+import_memory = tracemalloc.get_traced_memory()[0]
+button = adafruit_clue.clue.button_a
+read = time.perf_counter()
+read_memory = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+print(
+    f"import adafruit_clue:      {(imported - start) * 1e3:7.2f} ms {import_memory / 1024:8.1f} KB"
+)
+print(f"import and first button:   {(read - start) * 1e3:7.2f} ms {read_memory / 1024:8.1f} KB")
+print("(driver modules are stand-ins and are not counted; see clue_startup_benchmark.py)")
+print("driver modules loaded:", ", ".join(host_stubs.stubbed_modules_loaded()) or "none")
+submodules = sorted(name for name in sys.modules if name.startswith("adafruit_clue."))
+print("adafruit_clue submodules loaded:", ", ".join(submodules) or "none")
+print("NumPy loaded:", "numpy" in sys.modules)
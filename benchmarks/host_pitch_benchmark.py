@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Run synthetic tones through ``sound_frequency()`` on Linux and report the accuracy and time of
+each estimate, with NumPy and with the pure Python path.
+
+Run from the repository root::
+
+    python benchmarks/host_pitch_benchmark.py
+"""
+
+import os
+import sys
+import time
+
+sys.path[:0] = [os.path.dirname(__file__), os.path.join(os.path.dirname(__file__), "..")]
+
+import host_stubs
+
+host_stubs.install()
+
+import audiobusio
+
+import adafruit_clue
+
+REPEATS = 5
+
+numpy = adafruit_clue._numpy()
+paths = (("NumPy", numpy), ("Python", False)) if numpy is not None else (("Python", False),)
+clue = adafruit_clue.Clue()
+
+print(f"{'path':<7} {'tone Hz':>8} {'found Hz':>9} {'error %':>8} {'confidence':>11} {'ms':>8}")
+for name, module in paths:
+    adafruit_clue._np = module
+    # The pitch workspace keeps the module it was made with, so make a new one.
+    clue._pitch = None
+    for frequency in (82.4, 110, 196, 261.6, 440, 659.3, 880):
+        audiobusio.PDMIn.frequency = frequency
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            found, confidence = clue.sound_frequency()
+        elapsed = (time.perf_counter() - start) / REPEATS * 1e3
+        error = (found - frequency) / frequency * 100
+        print(
+            f"{name:<7} {frequency:>8.1f} {found:>9.1f} {error:>8.2f} {confidence:>11.2f} "
+            f"{elapsed:>8.2f}"
+        )
+adafruit_clue._np = numpy
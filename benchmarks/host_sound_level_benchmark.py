@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Compare the NumPy and pure Python paths of the RMS behind ``sound_level`` on Linux.
+
+Run from the repository root with NumPy installed::
+
+    python benchmarks/host_sound_level_benchmark.py
+"""
+
+import array
+import os
+import random
+import sys
+import timeit
+
+sys.path[:0] = [os.path.dirname(__file__), os.path.join(os.path.dirname(__file__), "..")]
+
+import host_stubs
+
+host_stubs.install()
+
+import adafruit_clue
+
+REPEATS = 200
+
+numpy = adafruit_clue._numpy()
+if numpy is None:
+    sys.exit("NumPy is needed to compare the two paths")
+
+print(f"{'samples':>8} {'NumPy us':>10} {'Python us':>10} {'speedup':>8}")
+for size in (64, 160, 512, 1024, 4096):
+    samples = array.array("H", (32768 + random.randint(-2000, 2000) for _ in range(size)))
+    adafruit_clue._np = numpy
+    fast = timeit.timeit(lambda: adafruit_clue.Clue._normalized_rms(samples), number=REPEATS)
+    adafruit_clue._np = False
+    slow = timeit.timeit(lambda: adafruit_clue.Clue._normalized_rms(samples), number=REPEATS)
+    adafruit_clue._np = numpy
+    fast_us = fast / REPEATS * 1e6
+    slow_us = slow / REPEATS * 1e6
+    print(f"{size:>8} {fast_us:>10.1f} {slow_us:>10.1f} {slow / fast:>7.1f}x")
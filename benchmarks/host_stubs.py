@@ -0,0 +1,120 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Minimal stand-ins for the CircuitPython modules ``adafruit_clue`` imports, so the host
+benchmarks can run it on Linux with CPython. Call :func:`install` before importing
+``adafruit_clue``.
+
+Only what the benchmarks use is modelled. The sensor, audio, NeoPixel and display text modules
+are empty modules that give a stand-in for any name, and are only created when imported, so
+:func:`stubbed_modules_loaded` shows which of them a benchmark needed. The microphone plays a
+sine wave whose frequency and amplitude can be set through ``audiobusio.PDMIn.frequency`` and
+``audiobusio.PDMIn.amplitude``.
+"""
+
+import importlib.abc
+import importlib.util
+import math
+import sys
+import types
+
+# Modules that are created empty, only when imported.
+STUBBED_MODULES = (
+    "adafruit_apds9960",
+    "adafruit_apds9960.apds9960",
+    "adafruit_bmp280",
+    "adafruit_display_text",
+    "adafruit_display_text.label",
+    "adafruit_lis3mdl",
+    "adafruit_lsm6ds",
+    "adafruit_lsm6ds.lsm6ds33",
+    "adafruit_lsm6ds.lsm6ds3trc",
+    "adafruit_sht31d",
+    "audiocore",
+    "audiopwmio",
+    "neopixel",
+    "terminalio",
+)
+
+
+class _Anything:
+    """An object that accepts any attribute or call, standing in for pins and hardware."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return _Anything()
+
+    def __call__(self, *args, **kwargs):
+        return _Anything()
+
+
+class _Group(list):
+    def __init__(self, **kwargs):
+        super().__init__()
+
+
+class _PDMIn:
+    frequency = 440.0
+    amplitude = 1000
+
+    def __init__(self, clock_pin, data_pin, sample_rate=16000, bit_depth=16):
+        self.sample_rate = sample_rate
+        self._time = 0
+
+    def record(self, buffer, length):
+        step = 2 * math.pi * self.frequency / self.sample_rate
+        for i in range(length):
+            buffer[i] = 32768 + int(self.amplitude * math.sin(step * (self._time + i)))
+        self._time += length
+        return length
+
+    def deinit(self):
+        pass
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, name, path, target=None):
+        if name in STUBBED_MODULES:
+            return importlib.util.spec_from_loader(name, self, is_package=True)
+        return None
+
+    @staticmethod
+    def create_module(spec):
+        return None
+
+    @staticmethod
+    def exec_module(module):
+        module.__getattr__ = lambda name: _Anything
+
+
+def _module(name, **attributes):
+    module = types.ModuleType(name)
+    module.__dict__.update(attributes)
+    sys.modules[name] = module
+    return module
+
+
+def install():
+    """Put the stand-in modules in ``sys.modules``."""
+    board = _module("board", DISPLAY=_Anything(), I2C=_Anything)
+    board.__getattr__ = lambda name: name
+    _module("digitalio", DigitalInOut=_Anything, Pull=_Anything(), Direction=_Anything())
+    _module(
+        "displayio",
+        Group=_Group,
+        CIRCUITPYTHON_TERMINAL=_Anything(),
+        Bitmap=_Anything,
+        Palette=_Anything,
+        TileGrid=_Anything,
+    )
+    _module("touchio", TouchIn=_Anything)
+    _module("microcontroller", Pin=object)
+    _module("audiobusio", PDMIn=_PDMIn)
+    sys.meta_path.insert(0, _StubFinder())
+
+
+def stubbed_modules_loaded():
+    """Return the names of the empty stand-in modules that have been imported."""
+    return [name for name in STUBBED_MODULES if name in sys.modules]
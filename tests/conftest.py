@@ -0,0 +1,15 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+"""Run ``adafruit_clue`` on CPython using the stand-in CircuitPython modules of the host
+benchmarks."""
+
+import os
+import sys
+
+_ROOT = os.path.join(os.path.dirname(__file__), "..")
+sys.path[:0] = [os.path.join(_ROOT, "benchmarks"), _ROOT]
+
+import host_stubs
+
+host_stubs.install()
@@ -0,0 +1,19 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+
+import pytest
+
+from adafruit_clue import Clue
+
+
+def test_read_all_rejects_unknown_sensor():
+    with pytest.raises(ValueError, match="humidty"):
+        Clue().read_all(("humidty",))
+
+
+def test_async_read_all_rejects_unknown_sensor():
+    with pytest.raises(ValueError, match="humidty"):
+        asyncio.run(Clue().async_read_all(("humidty",)))
@@ -0,0 +1,59 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import math
+import wave
+
+from adafruit_clue import Clue
+
+
+class FakeMic:
+    """A microphone that records a 440 Hz sine wave, counting up from where it left off."""
+
+    sample_rate = 8000
+
+    def __init__(self):
+        self.position = 0
+
+    def record(self, buffer, length):
+        for i in range(length):
+            buffer[i] = self.sample(self.position + i) + 0x8000
+        self.position += length
+        return length
+
+    def sample(self, index):
+        return int(1000 * math.sin(2 * math.pi * 440 * index / self.sample_rate))
+
+
+def read_wav(path):
+    with wave.open(str(path)) as wav:
+        params = (wav.getnchannels(), wav.getsampwidth(), wav.getframerate(), wav.getnframes())
+        frames = wav.readframes(wav.getnframes())
+    return params, [
+        int.from_bytes(frames[i : i + 2], "little", signed=True) for i in range(0, len(frames), 2)
+    ]
+
+
+def test_record_to_file_writes_signed_mono_wav(tmp_path):
+    path = tmp_path / "clip.wav"
+    mic = FakeMic()
+
+    missed = Clue().record_to_file(str(path), 0.5, frame_size=256, mic=mic)
+
+    params, samples = read_wav(path)
+    assert params == (1, 2, 8000, 4000)
+    assert samples == [mic.sample(i) for i in range(4000)]
+    assert missed >= 0
+
+
+def test_record_to_file_stops_part_way_through_a_frame(tmp_path):
+    path = tmp_path / "clip.wav"
+    mic = FakeMic()
+
+    Clue().record_to_file(str(path), 0.1, frame_size=300, mic=mic)
+
+    params, samples = read_wav(path)
+    assert params[3] == 800
+    assert samples == [mic.sample(i) for i in range(800)]
+    assert path.stat().st_size == 44 + 800 * 2
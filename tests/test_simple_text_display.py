@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import types
+
+import adafruit_display_text
+import pytest
+
+from adafruit_clue import Clue
+
+
+class FakeLabel:
+    """A label that keeps its text and color."""
+
+    def __init__(self, font, text="", color=0xFFFFFF):
+        self.text = text
+        self.color = color
+        self.x = 0
+        self.y = 0
+
+
+@pytest.fixture
+def fake_label(monkeypatch):
+    monkeypatch.setattr(adafruit_display_text, "label", types.SimpleNamespace(Label=FakeLabel))
+
+
+def test_redrawn_counts_each_changed_line_once(fake_label):
+    display = Clue.simple_text_display()
+    display[0].text = "one"
+    display[1].text = "two"
+    display.show()
+    assert display.redrawn == 2
+
+    display[0].text = "uno"
+    display[0].color = 0x123456
+    display[1].text = "two"
+    display.show()
+    assert display.redrawn == 1
+    assert display[0].label.text == "uno"
+    assert display[0].label.color == 0x123456
+
+    display.show()
+    assert display.redrawn == 0
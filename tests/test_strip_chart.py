@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Adafruit Industries
+#
+# SPDX-License-Identifier: MIT
+
+import displayio
+import pytest
+
+from adafruit_clue import Clue
+
+
+class FakeBitmap:
+    """A bitmap that keeps its pixels, so the chart's drawing can be compared."""
+
+    def __init__(self, width, height, value_count):
+        self.width = width
+        self.height = height
+        self.pixels = [0] * (width * height)
+
+    def __setitem__(self, index, value):
+        x, y = index
+        self.pixels[y * self.width + x] = value
+
+    def fill(self, value):
+        self.pixels = [value] * (self.width * self.height)
+
+
+@pytest.fixture
+def fake_bitmap(monkeypatch):
+    monkeypatch.setattr(displayio, "Bitmap", FakeBitmap)
+    monkeypatch.setattr(displayio, "Palette", lambda count: [0] * count)
+
+
+@pytest.mark.parametrize(
+    "samples",
+    [
+        [0, 9, 0, 9, 0, 9, 5, 5],
+        [0, 9, 0, 9, 0, 9, 5, 5, 1, 8, 2, 7, 3, 6, 4, 4],
+        [9, 0, 9, 0, 9, 0, 9, 0, 9, 0, 9, 0, 9],
+    ],
+)
+def test_incremental_drawing_matches_redraw(fake_bitmap, samples):
+    chart = Clue.strip_chart(width=6, height=10, minimum=0, maximum=9)
+    for sample in samples:
+        chart.add(sample)
+        drawn = list(chart._bitmap.pixels)
+        chart._redraw()
+        assert drawn == chart._bitmap.pixels